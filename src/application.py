@@ -22,8 +22,10 @@ gi.require_version('Gdk', '3.0')
 gi.require_version('Gtk', '3.0')
 from gi.repository import GLib, Gdk, Gio, Gtk
 
+import breaker
 import package
 from package import _
+from resources import Resources
 from window import DEFAULT_HEIGHT, DEFAULT_WIDTH, Window
 
 
@@ -38,6 +40,8 @@ class Application(Gtk.Application):
                          flags=Gio.ApplicationFlags.HANDLES_COMMAND_LINE,
                          **kwargs)
         self.cursor = None
+        # Rendering resources shared by the windows
+        self.resources = Resources()
 
         self.window_x = None
         self.window_y = None
@@ -53,6 +57,9 @@ class Application(Gtk.Application):
                              _('Initial window width'), _('w'))
         self.add_main_option('window-height', ord('h'), GLib.OptionFlags.NONE, GLib.OptionArg.INT,
                              _('Initial window height'), _('h'))
+        # e.g., --segmenter=table
+        self.add_main_option('segmenter', 0, GLib.OptionFlags.NONE, GLib.OptionArg.STRING,
+                             _('Word segmenter to use (icu or table)'), _('name'))
         self.add_main_option('version', ord('v'), GLib.OptionFlags.NONE, GLib.OptionArg.NONE,
                              _('Print version information'), None)
 
@@ -110,6 +117,13 @@ class Application(Gtk.Application):
             print(package.get_name() + ' ' + package.get_version())
             return 0
 
+        value = options.lookup_value('segmenter', GLib.VariantType.new('s'))
+        if value:
+            if value.get_string() not in breaker.SEGMENTERS:
+                command_line.printerr(f"Unknown segmenter '{value.get_string()}'\n")
+                return 1
+            breaker.set_segmenter(value.get_string())
+
         value = options.lookup_value('window-x', GLib.VariantType.new('i'))
         self.window_x = value.get_int32() if value else monitor_n_geo.x
         value = options.lookup_value('window-y', GLib.VariantType.new('i'))
@@ -168,6 +182,11 @@ class Application(Gtk.Application):
         action.connect('activate', self.on_quit)
         self.add_action(action)
 
+    def do_shutdown(self):
+        LOGGER.debug(f'do_shutdown: waited {breaker.get_wait_count()} times for boundaries')
+        breaker.shutdown()
+        Gtk.Application.do_shutdown(self)
+
     def is_opened(self, file):
         windows = self.get_windows()
         for window in windows:
@@ -178,6 +197,9 @@ class Application(Gtk.Application):
     def get_default_cursor(self):
         return self.cursor
 
+    def get_resources(self):
+        return self.resources
+
     def on_quit(self, *args):
         pathname = os.path.join(package.get_user_datadir(), 'session')
         LOGGER.info(f'on_quit: {pathname}')
@@ -14,9 +14,18 @@
 # You should have received a copy of the GNU Lesser General Public
 # License along with this library; if not, see <http://www.gnu.org/licenses/>.
 
+import concurrent.futures
 import logging
+import multiprocessing
+import os
+import re
+import time
+import unicodedata
+from array import array
+from bisect import bisect_left
 
-import icu
+import segmenter
+from offsetlist import OffsetList
 
 
 LOGGER = logging.getLogger(__name__)
@@ -29,6 +38,29 @@ PLAIN = 0
 BASE = 1
 RUBY = 2
 
+# Both ICU and the table-driven segmenter break characters and words after
+# these characters unless they
+# are followed by a combining or a format character.
+SAFE_BREAK = '、。「」『』（）【】！？'
+SAFE_BREAKS = re.compile('[' + SAFE_BREAK + ']')
+ANNOTATIONS = re.compile('[\uFFF9\uFFFA\uFFFB]')
+
+# Number of characters sent to a worker process at once
+BATCH_SIZE = 65536
+
+# 'icu' to use PyICU, or 'table' to use the table-driven segmenter, which
+# does not need to load PyICU and its data at startup. Chosen by the
+# --segmenter option or the FURIGANAPAD_SEGMENTER environment variable.
+SEGMENTERS = ('icu', 'table')
+
+_segmenter = os.getenv('FURIGANAPAD_SEGMENTER', 'icu')
+_icu = None
+_executor = None
+_thread = None
+
+# Number of times a cursor or word query had to wait for the worker thread
+_wait_count = 0
+
 # Note 'を' is intentionally removed from HIRAGANA_BREAK.
 HIRAGANA_BREAK = ('あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわん'
                   'ゔがぎぐげござじずぜぞだぢづでどばびぶべぼぁぃぅぇぉゃゅょっぱぴぷぺぽゎゐゑゝゞ')
@@ -42,76 +74,179 @@ def is_hiragana_break(s, offset):
     return False
 
 
-class Breaker:
+def set_segmenter(name):
+    global _segmenter
+    assert name in SEGMENTERS
+    _segmenter = name
 
-    def __init__(self, text=''):
-        self.length = 0
-        self.cursor_positions = []
-        self.word_starts = []
-        self.word_ends = []
-        if text:
-            self.set_text(text)
 
-    def following(self, offset):
-        assert 0 <= offset <= self.length
-        while True:
-            offset += 1
-            if self.length < offset:
-                return offset
-            if self.cursor_positions[offset]:
-                return offset
+def _get_boundaries(text):
+    # Returns the character boundaries and the word boundaries of text as
+    # lists of code point offsets.
+    global _icu, _segmenter
+    if _segmenter != 'table' and _icu is None:
+        try:
+            import icu
+            _icu = icu
+        except ImportError:
+            LOGGER.warning('PyICU is not available; using the table-driven segmenter')
+            _segmenter = 'table'
+    if _segmenter == 'table':
+        characters = segmenter.get_character_boundaries(text)
+        return characters, segmenter.get_word_boundaries(text, characters)
 
-    def following_word_end(self, offset):
-        assert 0 <= offset <= self.length
-        while True:
-            offset += 1
-            if self.length < offset:
-                return offset
-            if self.word_ends[offset]:
-                return offset
+    table = _get_code_point_offsets(text, text.encode('utf_16_le'))
+    boundaries = []
+    for boundary in (_icu.BreakIterator.createCharacterInstance(_icu.Locale.getJapan()),
+                     _icu.BreakIterator.createWordInstance(_icu.Locale.getJapan())):
+        boundary.setText(text)
+        offsets = [boundary.first()]
+        offsets.extend(boundary)
+        if table:
+            offsets = [table[offset] for offset in offsets]
+        boundaries.append(offsets)
+    return boundaries
 
-    def preceding(self, offset):
-        assert 0 <= offset <= self.length
-        while True:
-            offset -= 1
-            if offset < 0:
-                return offset
-            if self.cursor_positions[offset]:
-                return offset
 
-    def preceding_word_start(self, offset):
-        assert 0 <= offset <= self.length
-        while True:
-            offset -= 1
-            if offset < 0:
-                return offset
-            if self.word_starts[offset]:
-                return offset
-
-    def set_text(self, text):
-        self.length = len(text)
-        if not text:
-            self.cursor_positions = []
-            self.word_starts = []
-            self.word_ends = []
-            return
+def _get_code_point_offsets(text, u16str):
+    # Returns a table that maps UTF-16 offsets in u16str to code point
+    # offsets in text, or None if text has no surrogate pairs.
+    if len(u16str) == 2 * len(text):
+        return None
+    table = array('I')
+    for i, c in enumerate(text):
+        table.append(i)
+        if '\U00010000' <= c:
+            table.append(i)
+    table.append(len(text))
+    return table
 
-        self.cursor_positions = [0] * (self.length + 1)
-        self.word_starts = [0] * (self.length + 1)
-        self.word_ends = [0] * (self.length + 1)
-        u16str = text.encode('utf_16_le')
+
+def _get_annotations(text):
+    # Returns the sorted offsets of the annotation characters in text.
+    return array('I', [m.start() for m in ANNOTATIONS.finditer(text)])
+
+
+def _is_safe_break(text, offset, annotations):
+    # Returns True if characters and words are always broken at offset
+    # whatever text follows, so that segmentation can restart at offset.
+    # annotations are the sorted offsets of the annotation characters in
+    # text.
+    if offset <= 0 or len(text) <= offset:
+        return True
+    if text[offset - 1] not in SAFE_BREAK:
+        return False
+    if unicodedata.category(text[offset]) in ('Cf', 'Mc', 'Me', 'Mn'):
+        return False
+    # offset must not be inside an annotation.
+    i = bisect_left(annotations, offset)
+    return i == 0 or text[annotations[i - 1]] == IAT
+
+
+def _rfind_safe_break(text, end):
+    # Returns the offset of the last character in SAFE_BREAK before end, or
+    # -1 if there is none, looking back a sentence or so at a time.
+    while 0 < end:
+        start = max(0, end - 256)
+        m = None
+        for m in SAFE_BREAKS.finditer(text, start, end):
+            pass
+        if m:
+            return m.start()
+        end = start
+    return -1
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        # Do not fork the GTK process itself. The fork server preloads this
+        # module instead of __main__ so that it does not initialize GTK.
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('forkserver')
+            context.set_forkserver_preload(['breaker'])
+        else:
+            context = multiprocessing.get_context('spawn')
+        _executor = concurrent.futures.ProcessPoolExecutor(os.cpu_count(), mp_context=context)
+    return _executor
+
+
+def _get_thread():
+    global _thread
+    if _thread is None:
+        # A single worker thread applies the updates in the order they are submitted.
+        _thread = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix='breaker')
+    return _thread
+
+
+def _segment_batch(texts, name):
+    set_segmenter(name)
+    boundaries = []
+    for text in texts:
+        boundaries.append(Breaker()._segment(text, 0, len(text)))
+    return boundaries
+
+
+def _update(breaker, text, start, end, length, annotations):
+    try:
+        breaker.update(text, start, end, length, annotations)
+    except Exception:
+        LOGGER.exception('Could not update boundaries')
+        breaker.set_text(text, annotations)
+
+
+class Breaker:
+
+    def __init__(self, text='', annotations=None):
+        self.text = ''
+        self.length = 0
+        # Sorted offsets of the annotation characters in text
+        self.annotations = array('I')
+        # Sorted lists of offsets
+        self.cursor_positions = OffsetList()
+        self.word_starts = OffsetList()
+        self.word_ends = OffsetList()
+        if text:
+            self.set_text(text, annotations)
+
+    def _find_window(self, text, start, end, length, annotations):
+        # Returns the range of text that needs to be segmented again after
+        # replacing self.text[start:end] with text[start:start + length].
+        first = start
+        while 0 < first and not (_is_safe_break(text, first, annotations) and
+                                 _is_safe_break(self.text, first, self.annotations)):
+            first = _rfind_safe_break(text, first - 1) + 1
+        delta = length - (end - start)
+        last = start + length + 1
+        while last < len(text) and not (_is_safe_break(text, last, annotations) and
+                                        _is_safe_break(self.text, last - delta, self.annotations)):
+            m = SAFE_BREAKS.search(text, last)
+            last = m.end() if m else len(text)
+        return first, min(last, len(text))
+
+    def _segment(self, text, first, last):
+        # Returns the cursor positions in [first, last], the word starts in
+        # [first, last) and the word ends in (first, last] of text.
+        cursor_positions = array('I')
+        word_starts = array('I')
+        word_ends = array('I')
+        length = len(text)
+        if first == last:
+            cursor_positions.append(first)
+            return cursor_positions, word_starts, word_ends
+        window = text[first:last]
+        characters, words = _get_boundaries(window)
+        is_cursor_position = bytearray(last - first + 1)
 
         # Calculate cursor_positions
-        boundary = icu.BreakIterator.createCharacterInstance(icu.Locale.getJapan())
-        boundary.setText(text)
-        u16offset = boundary.first()
-        offset = len(u16str[:u16offset * 2].decode('utf_16_le', 'ignore'))
-        self.cursor_positions[offset] = 1
+        offset = first + characters[0]
+        is_cursor_position[offset - first] = 1
+        cursor_positions.append(offset)
         mode = PLAIN
-        for u16offset in boundary:
+        for boundary in characters[1:]:
             c = text[offset]    # previous character
-            offset = len(u16str[:u16offset * 2].decode('utf_16_le', 'ignore'))
-            d = text[offset] if offset < self.length else ''    # next character
+            offset = first + boundary
+            d = text[offset] if offset < length else ''    # next character
             if c == IAA:
                 mode = BASE
             elif d == IAS:
@@ -119,25 +254,146 @@ class Breaker:
             elif d == IAT:
                 mode = PLAIN
             elif mode != RUBY:
-                self.cursor_positions[offset] = 1
-        self.cursor_positions[-1] = 1
+                is_cursor_position[offset - first] = 1
+                cursor_positions.append(offset)
+        if last == length and not is_cursor_position[-1]:
+            is_cursor_position[-1] = 1
+            cursor_positions.append(length)
 
         # Calculate word_starts and word_ends
-        boundary = icu.BreakIterator.createWordInstance(icu.Locale.getJapan())
-        boundary.setText(text)
-        u16offset = boundary.first()
-        offset = len(u16str[:u16offset * 2].decode('utf_16_le', 'ignore'))
-        for u16offset in boundary:
-            if self.cursor_positions[offset]:
+        if first == 0:
+            word_starts.append(0)
+        offset = first + words[0]
+        for boundary in words[1:]:
+            if is_cursor_position[offset - first]:
                 if not text[offset].isspace() and not is_hiragana_break(text, offset):
-                    self.word_starts[offset] = 1
+                    if not word_starts or word_starts[-1] != offset:
+                        word_starts.append(offset)
             elif 0 < offset and text[offset - 1] == IAA:
-                self.word_starts[offset - 1] = 1
-            offset = len(u16str[:u16offset * 2].decode('utf_16_le', 'ignore'))
-            if self.cursor_positions[offset]:
+                if not word_starts or word_starts[-1] != offset - 1:
+                    word_starts.append(offset - 1)
+            offset = first + boundary
+            if is_cursor_position[offset - first]:
                 if 0 < offset and not text[offset - 1].isspace() and not is_hiragana_break(text, offset):
-                    self.word_ends[offset] = 1
+                    word_ends.append(offset)
             elif 1 < offset and text[offset - 1] == IAA:
-                self.word_ends[offset - 1] = 1
-        self.word_starts[0] = 1
-        self.word_ends[-1] = 1
+                word_ends.append(offset - 1)
+        if last == length and (not word_ends or word_ends[-1] != length):
+            word_ends.append(length)
+        return cursor_positions, word_starts, word_ends
+
+    def copy(self):
+        breaker = Breaker()
+        breaker.text = self.text
+        breaker.length = self.length
+        breaker.annotations = self.annotations
+        breaker.cursor_positions = self.cursor_positions.copy()
+        breaker.word_starts = self.word_starts.copy()
+        breaker.word_ends = self.word_ends.copy()
+        return breaker
+
+    def following(self, offset):
+        assert 0 <= offset <= self.length
+        offset = self.cursor_positions.following(offset)
+        return offset if 0 <= offset else self.length + 1
+
+    def following_word_end(self, offset):
+        assert 0 <= offset <= self.length
+        offset = self.word_ends.following(offset)
+        return offset if 0 <= offset else self.length + 1
+
+    def preceding(self, offset):
+        assert 0 <= offset <= self.length
+        return self.cursor_positions.preceding(offset)
+
+    def preceding_word_start(self, offset):
+        assert 0 <= offset <= self.length
+        return self.word_starts.preceding(offset)
+
+    def set_boundaries(self, text, boundaries, annotations=None):
+        # annotations are the sorted offsets of the annotation characters in
+        # text, which are found in text if None.
+        self.text = text
+        self.length = len(text)
+        self.annotations = _get_annotations(text) if annotations is None else annotations
+        self.cursor_positions, self.word_starts, self.word_ends = (OffsetList(offsets) for offsets in boundaries)
+
+    def set_text(self, text, annotations=None):
+        self.set_boundaries(text, self._segment(text, 0, len(text)) if text else ((), (), ()), annotations)
+
+    def update(self, text, start, end, length, annotations=None):
+        # Updates the boundaries after self.text[start:end] has been replaced
+        # with text[start:start + length] by segmenting only the sentences
+        # around the replaced text. The boundaries after them are shifted
+        # lazily by OffsetList.
+        if annotations is None:
+            annotations = _get_annotations(text)
+        if start < 0 or end < start or not self.text or not text:
+            self.set_text(text, annotations)
+            return
+        first, last = self._find_window(text, start, end, length, annotations)
+        if first == 0 and last == len(text):
+            self.set_text(text, annotations)
+            return
+        delta = length - (end - start)
+        cursor_positions, word_starts, word_ends = self._segment(text, first, last)
+        self.cursor_positions.replace(first, last - delta + 1, cursor_positions, delta)
+        self.word_starts.replace(first, last - delta, word_starts, delta)
+        self.word_ends.replace(first + 1, last - delta + 1, word_ends, delta)
+        self.text = text
+        self.length = len(text)
+        self.annotations = annotations
+
+
+def get_wait_count():
+    return _wait_count
+
+
+def update_in_background(breaker, text, start, end, length, annotations=None):
+    # Calls breaker.update() in the worker thread. Returns the future to be
+    # passed to wait_for_update() before breaker is used again.
+    return _get_thread().submit(_update, breaker, text, start, end, length, annotations)
+
+
+def wait_for_update(future):
+    global _wait_count
+    if future.done():
+        return
+    _wait_count += 1
+    t = time.perf_counter()
+    concurrent.futures.wait((future,))
+    LOGGER.debug(f'Waited {(time.perf_counter() - t) * 1000:.3f} ms for boundaries ({_wait_count} waits)')
+
+
+def shutdown():
+    # Stops the worker processes and the worker thread, dropping the work
+    # that has not started yet.
+    global _executor, _thread
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+    if _thread is not None:
+        _thread.shutdown(wait=False, cancel_futures=True)
+        _thread = None
+
+
+def segment_in_parallel(texts):
+    # Segments texts in worker processes. Returns a (future, index) pair for
+    # each text; future.result()[index] is the boundaries of the text to be
+    # passed to Breaker.set_boundaries().
+    executor = _get_executor()
+    pending = []
+    batch = []
+    size = 0
+    for text in texts:
+        batch.append(text)
+        size += len(text)
+        if BATCH_SIZE <= size:
+            future = executor.submit(_segment_batch, batch, _segmenter)
+            pending.extend((future, i) for i in range(len(batch)))
+            batch = []
+            size = 0
+    if batch:
+        future = executor.submit(_segment_batch, batch, _segmenter)
+        pending.extend((future, i) for i in range(len(batch)))
+    return pending
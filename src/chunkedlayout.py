@@ -0,0 +1,118 @@
+#
+# Copyright (c) 2025  Esrille Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+import logging
+from bisect import bisect_left, bisect_right
+
+import gi
+gi.require_version('Pango', '1.0')
+from gi.repository import Pango
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+def get_line_end(layout):
+    # Returns the right end of the last line of layout in Pango units.
+    count = layout.get_line_count()
+    ink, logical = layout.get_line_readonly(count - 1).get_extents()
+    end = logical.x + logical.width
+    if count == 1:
+        end += layout.get_indent()
+    return end
+
+
+def _get_last_baseline(layout):
+    # Returns the baseline of the last line of layout in Pango units.
+    ink, logical = layout.get_line_readonly(layout.get_line_count() - 1).get_extents()
+    return layout.get_size()[1] - (logical.y + logical.height)
+
+
+def _get_first_bottom(layout):
+    # Returns the bottom of the first line of layout in Pango units.
+    ink, logical = layout.get_line_readonly(0).get_extents()
+    return layout.get_baseline() + logical.y + logical.height
+
+
+class ChunkedLayout:
+    # The layout of a giant paragraph made of the layouts of its chunks.
+    # The layout of a chunk is indented to continue the last line of the
+    # previous chunk, or not indented to begin the next line if the first
+    # line of the chunk does not fit there, so that the chunks wrap as a
+    # single layout would. It implements the methods of Pango.Layout that
+    # FuriganaView uses with the UTF-8 indices and the coordinates of the
+    # whole paragraph in Pango units.
+
+    def __init__(self, chunks, layouts, indices, spacing):
+        # indices are the UTF-8 indices where the layouts begin.
+        self.chunks = chunks
+        self.layouts = layouts
+        self.indices = indices
+        self.spacing = spacing
+        self.tops = []
+        self.bottoms = []
+        self.width = 0
+        y = 0
+        for k, layout in enumerate(layouts):
+            width, height = layout.get_size()
+            if 0 < k:
+                if layout.get_indent():
+                    # Align the first baseline with the last one of the previous chunk.
+                    y = self.tops[k - 1] + _get_last_baseline(layouts[k - 1]) - layout.get_baseline()
+                else:
+                    y = self.bottoms[k - 1] + spacing
+            self.tops.append(y)
+            self.bottoms.append(y + height)
+            self.width = max(self.width, width)
+        self.height = self.bottoms[-1] if layouts else 0
+
+    def find_chunk(self, index):
+        # Returns the number of the chunk that contains index.
+        return max(0, bisect_right(self.indices, index) - 1)
+
+    def get_chunks(self, top, bottom):
+        # Returns the range of the chunks that overlap from top to bottom.
+        return range(bisect_right(self.bottoms, top), bisect_left(self.tops, bottom))
+
+    def get_cursor_pos(self, index):
+        k = self.find_chunk(index)
+        strong, weak = self.layouts[k].get_cursor_pos(index - self.indices[k])
+        strong.y += self.tops[k]
+        weak.y += self.tops[k]
+        return strong, weak
+
+    def get_pixel_size(self):
+        return (-(-self.width // Pango.SCALE), -(-self.height // Pango.SCALE))
+
+    def get_size(self):
+        return self.width, self.height
+
+    def index_to_pos(self, index):
+        k = self.find_chunk(index)
+        pos = self.layouts[k].index_to_pos(index - self.indices[k])
+        pos.y += self.tops[k]
+        return pos
+
+    def xy_to_index(self, x, y):
+        # A line takes the half of the line spacing above it as in Pango.
+        k = max(0, bisect_right(self.tops, y + self.spacing // 2) - 1)
+        # A line shared by several chunks is looked up in the chunk at x.
+        while 0 < k and 0 < self.layouts[k].get_indent() and x < self.layouts[k].get_indent():
+            if self.tops[k] + _get_first_bottom(self.layouts[k]) + self.spacing - self.spacing // 2 <= y:
+                break
+            k -= 1
+        inside, index, trailing = self.layouts[k].xy_to_index(x, y - self.tops[k])
+        return inside, self.indices[k] + index, trailing
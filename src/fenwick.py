@@ -0,0 +1,62 @@
+#
+# Copyright (c) 2025  Esrille Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+# Fenwick trees over the sizes of the chunks of Rope and HeightIndex, and
+# over the shifts of the chunks of OffsetList. tree[0] is unused, and
+# tree[i] is the sum of values (i - (i & -i), i].
+
+
+def add(tree, k, delta):
+    # Adds delta to the k-th value.
+    i = k + 1
+    while i < len(tree):
+        tree[i] += delta
+        i += i & -i
+
+
+def build(values):
+    # Returns the tree of values in O(len(values)).
+    m = len(values)
+    tree = [0] * (m + 1)
+    for i in range(1, m + 1):
+        tree[i] += values[i - 1]
+        j = i + (i & -i)
+        if j <= m:
+            tree[j] += tree[i]
+    return tree
+
+
+def prefix(tree, k):
+    # Returns the sum of the first k values.
+    total = 0
+    while 0 < k:
+        total += tree[k]
+        k -= k & -k
+    return total
+
+
+def search(tree, value):
+    # Returns the largest k such that the sum of the first k values is not
+    # greater than value, and value minus that sum.
+    m = len(tree) - 1
+    k = 0
+    step = 1 << m.bit_length()
+    while step:
+        if k + step <= m and tree[k + step] <= value:
+            k += step
+            value -= tree[k]
+        step >>= 1
+    return k, value
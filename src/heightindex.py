@@ -0,0 +1,139 @@
+#
+# Copyright (c) 2025  Esrille Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+import logging
+from itertools import accumulate
+
+import fenwick
+
+
+LOGGER = logging.getLogger(__name__)
+
+CHUNK_SIZE = 512
+
+
+class HeightIndex:
+    # A list of paragraph heights stored in chunks of at most 2 * CHUNK_SIZE
+    # lines. Fenwick trees over the line counts and the heights of the
+    # chunks give the y coordinate of a line and the line at a y coordinate
+    # in O(log n + CHUNK_SIZE). Replacing lines costs O(n / CHUNK_SIZE +
+    # CHUNK_SIZE), so that paragraphs can be inserted and removed without
+    # rebuilding the whole index.
+
+    def __init__(self, heights=()):
+        self._chunks = []
+        self._length = 0
+        self._counts = [0]
+        self._sums = [0]
+        self[0:0] = heights
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            assert step == 1
+            heights = []
+            if start < stop:
+                k, offset = self._locate(start)
+                while len(heights) < stop - start:
+                    heights.extend(self._chunks[k][offset:offset + stop - start - len(heights)])
+                    k += 1
+                    offset = 0
+            return heights
+        k, offset = self._locate(self._index(index))
+        return self._chunks[k][offset]
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            yield from chunk
+
+    def __len__(self):
+        return self._length
+
+    def __setitem__(self, index, value):
+        if not isinstance(index, slice):
+            k, offset = self._locate(self._index(index))
+            fenwick.add(self._sums, k, value - self._chunks[k][offset])
+            self._chunks[k][offset] = value
+            return
+        start, stop, step = index.indices(self._length)
+        assert step == 1
+        stop = max(start, stop)
+        heights = list(value)
+        if not self._chunks:
+            self._chunks = [heights[i:i + CHUNK_SIZE] for i in range(0, len(heights), CHUNK_SIZE)]
+        else:
+            first, offset = self._locate_end(start)
+            last, end = self._locate_end(stop)
+            lines = self._chunks[first][:offset] + heights + self._chunks[last][end:]
+            if len(lines) <= 2 * CHUNK_SIZE:
+                chunks = [lines] if lines else []
+            else:
+                chunks = [lines[i:i + CHUNK_SIZE] for i in range(0, len(lines), CHUNK_SIZE)]
+            self._chunks[first:last + 1] = chunks
+        self._length += len(heights) - (stop - start)
+        self._build()
+
+    def _build(self):
+        self._counts = fenwick.build([len(chunk) for chunk in self._chunks])
+        self._sums = fenwick.build([sum(chunk) for chunk in self._chunks])
+
+    def _index(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('HeightIndex index out of range')
+        return index
+
+    def _locate(self, line):
+        # Returns the chunk number and the offset within the chunk of line.
+        return fenwick.search(self._counts, line)
+
+    def _locate_end(self, line):
+        # Same as _locate() but returns the end of the last chunk for
+        # len(self).
+        if line == self._length:
+            return len(self._chunks) - 1, len(self._chunks[-1])
+        return self._locate(line)
+
+    def append(self, height):
+        self[self._length:self._length] = [height]
+
+    def clear(self):
+        self._chunks = []
+        self._length = 0
+        self._counts = [0]
+        self._sums = [0]
+
+    def get_line(self, y):
+        # Returns the line at y, or len(self) if y is below the last line.
+        k, y = fenwick.search(self._sums, y)
+        line = fenwick.prefix(self._counts, k)
+        if k < len(self._chunks):
+            for bottom in accumulate(self._chunks[k]):
+                if y < bottom:
+                    break
+                line += 1
+        return line
+
+    def get_total(self):
+        return fenwick.prefix(self._sums, len(self._chunks))
+
+    def get_y(self, line):
+        # Returns the sum of the heights of the lines before line.
+        if self._length <= line:
+            return self.get_total()
+        k, offset = self._locate(line)
+        return fenwick.prefix(self._sums, k) + sum(self._chunks[k][:offset])
@@ -0,0 +1,68 @@
+#
+# Copyright (c) 2025  Esrille Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+import logging
+from collections import OrderedDict
+
+
+LOGGER = logging.getLogger(__name__)
+
+CACHE_SIZE = 256
+
+
+class LRUCache:
+    # A least recently used cache of layouts and other objects made from
+    # the text. hits and misses count the lookups to tune CACHE_SIZE.
+
+    def __init__(self, size=CACHE_SIZE, sizeof=None):
+        # size limits the number of the values, or the sum of sizeof(value)
+        # if sizeof is given.
+        self.size = size
+        self.sizeof = sizeof
+        self.total = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def _sizeof(self, value):
+        return self.sizeof(value) if self.sizeof else 1
+
+    def clear(self):
+        self._items.clear()
+        self.total = 0
+
+    def get(self, key):
+        value = self._items.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._items.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.total -= self._sizeof(old)
+        self._items[key] = value
+        self.total += self._sizeof(value)
+        # Keep the newest value even if it alone exceeds size.
+        while self.size < self.total and 1 < len(self._items):
+            key, old = self._items.popitem(last=False)
+            self.total -= self._sizeof(old)
@@ -24,7 +24,6 @@ import sys
 from gi.repository import GLib
 
 import package
-from application import Application
 
 
 GLib.set_prgname(package.get_name())
@@ -39,6 +38,11 @@ def main():
     if __debug__:
         logging.basicConfig(level=logging.DEBUG)
 
+    # Import GTK here rather than at the top. Where the fork server is not
+    # available, breaker falls back to spawning its worker processes, which
+    # import this module again as __mp_main__.
+    from application import Application
+
     app = Application()
     signal.signal(signal.SIGINT, signal.SIG_DFL)
     exit_status = app.run(sys.argv)
@@ -0,0 +1,138 @@
+#
+# Copyright (c) 2025  Esrille Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+
+import logging
+from array import array
+from bisect import bisect_left, bisect_right
+
+import fenwick
+
+
+LOGGER = logging.getLogger(__name__)
+
+CHUNK_SIZE = 512
+
+
+def _shift(offsets, shift):
+    if shift == 0:
+        return offsets
+    return array('I', [offset + shift for offset in offsets])
+
+
+class OffsetList:
+    # A sorted list of offsets stored in chunks of at most 2 * CHUNK_SIZE
+    # offsets. The offsets after an edit are shifted by adding the delta to
+    # a Fenwick tree over the shifts of the chunks rather than to each
+    # offset, and the shift of a chunk is applied when its offsets are
+    # looked up. Looking up an offset costs O(log^2 n). Replacing k offsets
+    # costs O(log n + k + CHUNK_SIZE) as long as no chunks are split or
+    # removed, and O(n / CHUNK_SIZE * log n) otherwise.
+
+    def __init__(self, offsets=()):
+        self._set_offsets(array('I', offsets))
+
+    def __iter__(self):
+        for k, chunk in enumerate(self._chunks):
+            shift = self._get_shift(k)
+            for offset in chunk:
+                yield offset + shift
+
+    def _get_shift(self, k):
+        # Returns the shift of the offsets in the k-th chunk.
+        return fenwick.prefix(self._tree, k + 1)
+
+    def _locate(self, offset, right=False):
+        # Returns the chunk number and the index within the chunk where
+        # offset would be inserted by bisect_left(), or by bisect_right() if
+        # right. The chunk number is len(self._chunks) if all the offsets
+        # are less than offset.
+        lo = 0
+        hi = len(self._chunks)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            last = self._chunks[mid][-1] + self._get_shift(mid)
+            if last < offset or (right and last == offset):
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(self._chunks):
+            return lo, 0
+        offset -= self._get_shift(lo)
+        return lo, bisect_right(self._chunks[lo], offset) if right else bisect_left(self._chunks[lo], offset)
+
+    def _set_offsets(self, offsets):
+        self._chunks = [offsets[i:i + CHUNK_SIZE] for i in range(0, len(offsets), CHUNK_SIZE)]
+        self._tree = fenwick.build([0] * len(self._chunks))
+
+    def copy(self):
+        offsets = OffsetList()
+        offsets._chunks = [array('I', chunk) for chunk in self._chunks]
+        offsets._tree = list(self._tree)
+        return offsets
+
+    def following(self, offset):
+        # Returns the first offset greater than offset, or -1 if there is none.
+        k, i = self._locate(offset, True)
+        if k == len(self._chunks):
+            return -1
+        return self._chunks[k][i] + self._get_shift(k)
+
+    def preceding(self, offset):
+        # Returns the last offset less than offset, or -1 if there is none.
+        k, i = self._locate(offset)
+        if i == 0:
+            if k == 0:
+                return -1
+            k -= 1
+            i = len(self._chunks[k])
+        return self._chunks[k][i - 1] + self._get_shift(k)
+
+    def replace(self, start, stop, offsets, delta):
+        # Replaces the offsets from start to stop, excluding stop, with
+        # offsets, and adds delta to the offsets after them.
+        if not self._chunks:
+            self._set_offsets(array('I', offsets))
+            return
+        first, i = self._locate(start)
+        last, j = self._locate(stop)
+        if first == len(self._chunks):
+            first -= 1
+            i = len(self._chunks[first])
+        if last == len(self._chunks):
+            last -= 1
+            j = len(self._chunks[last])
+        shifts = [self._get_shift(k) for k in range(first, last + 1)]
+        # The offsets of the replaced chunks are stored without shifts.
+        items = _shift(self._chunks[first][:i], shifts[0])
+        items.extend(offsets)
+        items.extend(_shift(self._chunks[last][j:], shifts[-1] + delta))
+        if len(items) <= 2 * CHUNK_SIZE:
+            chunks = [items] if items else []
+        else:
+            chunks = [items[n:n + CHUNK_SIZE] for n in range(0, len(items), CHUNK_SIZE)]
+        if len(chunks) == last + 1 - first:
+            prev = 0
+            for k, shift in enumerate(shifts, first):
+                fenwick.add(self._tree, k, prev - shift)
+                prev = shift
+            fenwick.add(self._tree, last + 1, prev + delta)
+            self._chunks[first:last + 1] = chunks
+            return
+        shifts = [self._get_shift(k) for k in range(len(self._chunks))]
+        shifts[first:] = [0] * len(chunks) + [shift + delta for shift in shifts[last + 1:]]
+        self._chunks[first:last + 1] = chunks
+        self._tree = fenwick.build([shift - prev for prev, shift in zip([0] + shifts, shifts)])
@@ -0,0 +1,96 @@
+#
+# Copyright (c) 2025  Esrille Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+import logging
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class PreeditLayout:
+    # The layout of a paragraph being composed made of the layout of the
+    # committed text and a layout of the line with the preedit text, which
+    # is drawn over that line. It is used only while the line with the
+    # preedit text still fits in the width, so that the other lines do not
+    # move and composing lays out a single line. It implements the methods
+    # of Pango.Layout that FuriganaView uses with the UTF-8 indices of the
+    # text with the preedit text in Pango units.
+
+    def __init__(self, layout, line_layout, line, start, end, top, bottom, y, shift):
+        # line is the number of the line in layout, start and end its UTF-8
+        # indices, top and bottom its y range, y the top of its logical
+        # extents, and shift the length of the preedit text in bytes.
+        self.layout = layout
+        self.line_layout = line_layout
+        self.line = line
+        self.last = line == layout.get_line_count() - 1
+        self.start = start
+        self.end = end
+        self.top = top
+        self.bottom = bottom
+        self.y = y
+        self.shift = shift
+
+    def _in_line(self, index):
+        # The end of a line that wraps is the beginning of the next line.
+        return self.start <= index and (index < self.end + self.shift or self.last)
+
+    def get_cursor_pos(self, index):
+        if not self._in_line(index):
+            return self.layout.get_cursor_pos(index if index < self.start else index - self.shift)
+        strong, weak = self.line_layout.get_cursor_pos(index - self.start)
+        strong.y += self.y
+        weak.y += self.y
+        return strong, weak
+
+    def get_baseline(self):
+        return self.layout.get_baseline()
+
+    def get_indent(self):
+        return self.layout.get_indent()
+
+    def get_line_count(self):
+        return self.layout.get_line_count()
+
+    def get_line_readonly(self, line):
+        if line == self.line:
+            return self.line_layout.get_line_readonly(0)
+        return self.layout.get_line_readonly(line)
+
+    def get_pixel_size(self):
+        return self.layout.get_pixel_size()
+
+    def get_size(self):
+        return self.layout.get_size()
+
+    def index_to_pos(self, index):
+        if not self._in_line(index):
+            return self.layout.index_to_pos(index if index < self.start else index - self.shift)
+        pos = self.line_layout.index_to_pos(index - self.start)
+        pos.y += self.y
+        return pos
+
+    def xy_to_index(self, x, y):
+        # The y range includes the line spacing around the line, and the
+        # first and the last lines extend above and below the layout.
+        if (self.top <= y or self.start == 0) and (y < self.bottom or self.last):
+            y = max(0, min(y - self.y, self.line_layout.get_size()[1] - 1))
+            inside, index, trailing = self.line_layout.xy_to_index(x, y)
+            return inside, self.start + index, trailing
+        inside, index, trailing = self.layout.xy_to_index(x, y)
+        if self.end <= index:
+            index += self.shift
+        return inside, index, trailing
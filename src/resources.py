@@ -0,0 +1,89 @@
+#
+# Copyright (c) 2025  Esrille Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import math
+from weakref import WeakKeyDictionary
+
+import gi
+gi.require_version('Pango', '1.0')
+gi.require_version('PangoCairo', '1.0')
+from gi.repository import Pango, PangoCairo
+
+from lrucache import LRUCache
+
+
+LOGGER = logging.getLogger(__name__)
+
+# Number of bytes of the rendered paragraphs to keep for scrolling
+SURFACE_CACHE_SIZE = 64 * 1024 * 1024
+
+
+def _get_surface_size(surface):
+    return surface.get_stride() * surface.get_height()
+
+
+class Resources:
+    # Rendering resources shared by the views of an application. The caches
+    # are keyed by the paragraph contents rather than the paragraphs, so
+    # that views showing the same text reuse each other's layouts. The keys
+    # include the font key, so that views on screens with different
+    # resolutions, font options or scale factors do not share layouts or
+    # metrics. Pango already shares the font map and its glyph caches in the
+    # process.
+
+    def __init__(self):
+        self.metrics = {}
+        self.layouts = LRUCache()
+        self.rubies = LRUCache()
+        self.sentences = LRUCache()
+        self.line_boxes = LRUCache()
+        self.surfaces = LRUCache(SURFACE_CACHE_SIZE, _get_surface_size)
+        # The layouts of giant paragraphs and their chunks, and the ruby
+        # runs of the chunks as (key, value) by paragraph, which live as
+        # long as the paragraphs.
+        self.chunk_layouts = WeakKeyDictionary()
+        self.chunk_rubies = WeakKeyDictionary()
+
+    def get_font_key(self, widget, font_desc):
+        # Returns the key of font_desc rendered by the Pango context of
+        # widget.
+        context = widget.get_pango_context()
+        font_options = PangoCairo.context_get_font_options(context)
+        return (font_desc.to_string(), PangoCairo.context_get_resolution(context),
+                font_options.hash() if font_options else 0, widget.get_scale_factor())
+
+    def get_metrics(self, widget, font_desc):
+        # Returns the line height, the spacing between lines, and the width
+        # of a full-width character of font_desc in pixels.
+        key = self.get_font_key(widget, font_desc)
+        metrics = self.metrics.get(key)
+        if metrics is not None:
+            return metrics
+        context = widget.create_pango_context()
+        context.set_font_description(font_desc)
+        font_metrics = context.get_metrics(None, None)
+        if Pango.version_check(1, 44, 0) is None:
+            line_height = font_metrics.get_height()
+        else:
+            line_height = font_metrics.get_ascent() + font_metrics.get_descent()
+        layout = Pango.Layout(context)
+        layout.set_text('あ', -1)
+        metrics = (math.ceil(line_height * 1.6 / Pango.SCALE),
+                   math.ceil(line_height * 0.6 / Pango.SCALE),
+                   max(1, layout.get_pixel_size()[0]))
+        self.metrics[key] = metrics
+        return metrics
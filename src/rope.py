@@ -0,0 +1,178 @@
+#
+# Copyright (c) 2025  Esrille Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+import logging
+
+import fenwick
+
+
+LOGGER = logging.getLogger(__name__)
+
+CHUNK_SIZE = 512
+
+
+class Rope:
+    # A list-like sequence stored as a list of chunks of at most 2 * CHUNK_SIZE
+    # items. A Fenwick tree over the chunk lengths locates an item in
+    # O(log n), and is updated in O(log n) as long as no chunks are split,
+    # merged or removed. Inserting and deleting k items within the existing
+    # chunks cost O(log n + k + CHUNK_SIZE). The tree is rebuilt in
+    # O(n / CHUNK_SIZE) when the chunks change, which happens at most once
+    # per CHUNK_SIZE items inserted into a chunk, or when whole chunks are
+    # deleted.
+
+    def __init__(self, items=()):
+        self._chunks = []
+        self._length = 0
+        self._tree = [0]
+        self[0:0] = items
+
+    def __bool__(self):
+        return 0 < self._length
+
+    def __delitem__(self, index):
+        start, stop = self._range(index)
+        if stop <= start:
+            return
+        k, offset = self._locate(start)
+        count = stop - start
+        removed = False
+        while 0 < count:
+            chunk = self._chunks[k]
+            n = min(count, len(chunk) - offset)
+            del chunk[offset:offset + n]
+            count -= n
+            if chunk:
+                if not removed:
+                    self._add(k, -n)
+                k += 1
+                offset = 0
+            else:
+                del self._chunks[k]
+                removed = True
+        self._length -= stop - start
+        if 0 < k < len(self._chunks) and len(self._chunks[k - 1]) + len(self._chunks[k]) <= CHUNK_SIZE:
+            self._chunks[k - 1].extend(self._chunks.pop(k))
+            removed = True
+        if removed:
+            self._build()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop = self._range(index)
+            items = []
+            if start < stop:
+                k, offset = self._locate(start)
+                while len(items) < stop - start:
+                    chunk = self._chunks[k]
+                    items.extend(chunk[offset:offset + stop - start - len(items)])
+                    k += 1
+                    offset = 0
+            return items
+        k, offset = self._locate(self._index(index))
+        return self._chunks[k][offset]
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            yield from chunk
+
+    def __len__(self):
+        return self._length
+
+    def __setitem__(self, index, value):
+        if not isinstance(index, slice):
+            k, offset = self._locate(self._index(index))
+            self._chunks[k][offset] = value
+            return
+        start, stop = self._range(index)
+        del self[start:stop]
+        items = list(value)
+        if not items:
+            return
+        if not self._chunks:
+            k, offset = 0, 0
+            self._chunks.append([])
+        elif start == self._length:
+            k = len(self._chunks) - 1
+            offset = len(self._chunks[k])
+        else:
+            k, offset = self._locate(start)
+        chunk = self._chunks[k]
+        self._length += len(items)
+        if len(chunk) + len(items) <= 2 * CHUNK_SIZE:
+            chunk[offset:offset] = items
+            if len(self._chunks) == len(self._tree) - 1:
+                self._add(k, len(items))
+            else:
+                self._build()
+            return
+        items = chunk[:offset] + items + chunk[offset:]
+        self._chunks[k:k + 1] = [items[i:i + CHUNK_SIZE] for i in range(0, len(items), CHUNK_SIZE)]
+        self._build()
+
+    def _add(self, k, delta):
+        fenwick.add(self._tree, k, delta)
+
+    def _build(self):
+        self._tree = fenwick.build([len(chunk) for chunk in self._chunks])
+
+    def _index(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('Rope index out of range')
+        return index
+
+    def _locate(self, index):
+        # Returns the chunk number and the offset within the chunk of index.
+        return fenwick.search(self._tree, index)
+
+    def _range(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            assert step == 1
+            return start, max(start, stop)
+        index = self._index(index)
+        return index, index + 1
+
+    def append(self, item):
+        self.insert(self._length, item)
+
+    def clear(self):
+        del self[:]
+
+    def insert(self, index, item):
+        if index < 0:
+            index = max(0, index + self._length)
+        index = min(index, self._length)
+        if not self._chunks:
+            self._chunks.append([item])
+            self._length = 1
+            self._build()
+            return
+        if index == self._length:
+            k = len(self._chunks) - 1
+            offset = len(self._chunks[k])
+        else:
+            k, offset = self._locate(index)
+        chunk = self._chunks[k]
+        chunk.insert(offset, item)
+        self._length += 1
+        if len(chunk) <= 2 * CHUNK_SIZE:
+            self._add(k, 1)
+            return
+        self._chunks[k:k + 1] = [chunk[:CHUNK_SIZE], chunk[CHUNK_SIZE:]]
+        self._build()
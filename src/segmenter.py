@@ -0,0 +1,185 @@
+#
+# Copyright (c) 2025  Esrille Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+# A table-driven alternative to the ICU break iterators. Characters are
+# segmented into extended grapheme clusters as in UAX #29, and words are
+# segmented at the changes of Japanese script runs.
+
+import logging
+from bisect import bisect_right
+
+from unicodetables import STARTS, VALUES
+
+
+LOGGER = logging.getLogger(__name__)
+
+IAA = '\uFFF9'  # IAA (INTERLINEAR ANNOTATION ANCHOR)
+IAS = '\uFFFA'  # IAS (INTERLINEAR ANNOTATION SEPARATOR)
+IAT = '\uFFFB'  # IAT (INTERLINEAR ANNOTATION TERMINATOR)
+
+# Grapheme_Cluster_Break
+OTHER = 0
+CONTROL = 1
+EXTEND = 2
+ZWJ = 3
+SPACING_MARK = 4
+PREPEND = 5
+REGIONAL_INDICATOR = 6
+L = 7
+V = 8
+T = 9
+LV = 10
+LVT = 11
+EXTENDED_PICTOGRAPHIC = 12
+
+# Word classes for Japanese script runs
+WORD_OTHER = 0
+WORD_IGNORE = 1
+WORD_SPACE = 2
+WORD_LETTER = 3
+WORD_HAN = 4
+WORD_HIRAGANA = 5
+WORD_KATAKANA = 6
+WORD_EXTENDER = 7
+
+# Characters that do not break a word between letters or digits, e.g., "don't" or "3.14"
+MID_LETTER = '\'.:,·’'
+
+_classes = {}
+
+
+def _get_classes(c):
+    value = _classes.get(c)
+    if value is None:
+        value = VALUES[bisect_right(STARTS, ord(c)) - 1]
+        _classes[c] = value
+    return value
+
+
+def _is_cluster_continued(prev, next, ri_count, pictographic):
+    if prev == CONTROL or next == CONTROL:
+        return False
+    if prev == L and next in (L, V, LV, LVT):
+        return True
+    if prev in (LV, V) and next in (V, T):
+        return True
+    if prev in (LVT, T) and next == T:
+        return True
+    if next in (EXTEND, ZWJ, SPACING_MARK):
+        return True
+    if prev == PREPEND:
+        return True
+    if prev == ZWJ and next == EXTENDED_PICTOGRAPHIC:
+        return pictographic
+    if prev == REGIONAL_INDICATOR and next == REGIONAL_INDICATOR:
+        return ri_count % 2 == 1
+    return False
+
+
+def get_character_boundaries(text):
+    # Returns the offsets of the extended grapheme cluster boundaries in
+    # text including 0 and len(text).
+    boundaries = [0]
+    if not text:
+        return boundaries
+    prev = _get_classes(text[0]) >> 4
+    ri_count = 1 if prev == REGIONAL_INDICATOR else 0
+    pictographic = prev == EXTENDED_PICTOGRAPHIC
+    for i in range(1, len(text)):
+        next = _get_classes(text[i]) >> 4
+        if not _is_cluster_continued(prev, next, ri_count, pictographic):
+            boundaries.append(i)
+        ri_count = ri_count + 1 if next == REGIONAL_INDICATOR else 0
+        if next == EXTENDED_PICTOGRAPHIC:
+            pictographic = True
+        elif next not in (EXTEND, ZWJ) or prev == ZWJ:
+            # Only Extend characters may come between the pictograph and ZWJ.
+            pictographic = False
+        prev = next
+    boundaries.append(len(text))
+    return boundaries
+
+
+def is_character_boundary(text, offset):
+    # Returns True if offset is an extended grapheme cluster boundary in
+    # text. Only the characters from the last offset where clusters are
+    # broken whatever precedes them are segmented.
+    if offset <= 0 or len(text) <= offset:
+        return True
+    start = offset - 1
+    while 0 < start and (_get_classes(text[start - 1]) >> 4 not in (OTHER, CONTROL) or
+                         _get_classes(text[start]) >> 4 in (EXTEND, ZWJ, SPACING_MARK)):
+        start -= 1
+    return offset - start in get_character_boundaries(text[start:offset + 1])
+
+
+def get_word_boundaries(text, character_boundaries=None):
+    # Returns the offsets of the word boundaries in text including 0 and
+    # len(text). As ICU does, characters of the Extend and Format classes,
+    # including the interlinear annotation characters, belong to the
+    # character before them.
+    boundaries = [0]
+    if not text:
+        return boundaries
+    if character_boundaries is None:
+        character_boundaries = get_character_boundaries(text)
+    clusters = set(character_boundaries)
+
+    # The offsets and the word classes of the characters that are not ignored.
+    # The base text of an annotation is a word of its own, and the
+    # annotation text is ignored.
+    offsets = [0]
+    classes = [_get_classes(text[0]) & 0xf]
+    separated = set()
+    reading = text[0] == IAS
+    for i in range(1, len(text)):
+        c = text[i]
+        if c == IAA:
+            separated.add(len(offsets))
+        elif c == IAS:
+            reading = True
+        elif c == IAT:
+            reading = False
+            separated.add(len(offsets))
+        elif not reading:
+            word = _get_classes(c) & 0xf
+            if word != WORD_IGNORE:
+                offsets.append(i)
+                classes.append(word)
+
+    prev = classes[0]
+    for k in range(1, len(offsets)):
+        i = offsets[k]
+        next = classes[k]
+        if next == WORD_EXTENDER and prev in (WORD_HAN, WORD_HIRAGANA, WORD_KATAKANA):
+            next = prev
+        if k in separated:
+            joined = False
+        elif prev == WORD_HIRAGANA and next == WORD_HIRAGANA:
+            joined = text[i] != 'を' and text[offsets[k - 1]] != 'を'
+        elif prev == next:
+            joined = next in (WORD_SPACE, WORD_LETTER, WORD_HAN, WORD_KATAKANA)
+        elif prev == WORD_LETTER and text[i] in MID_LETTER:
+            joined = k + 1 < len(offsets) and classes[k + 1] == WORD_LETTER
+            if joined:
+                next = WORD_LETTER
+        else:
+            joined = False
+        if not joined and i in clusters:
+            boundaries.append(i)
+        prev = next
+    boundaries.append(len(text))
+    return boundaries
@@ -15,8 +15,12 @@
 # License along with this library; if not, see <http://www.gnu.org/licenses/>.
 
 import logging
+import os
 import re
 import time
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, count
 
 import gi
 gi.require_version('Gtk', '3.0')
@@ -24,7 +28,9 @@ gi.require_version('Pango', '1.0')
 gi.require_version('PangoCairo', '1.0')
 from gi.repository import GObject
 
-from breaker import Breaker
+from breaker import Breaker, is_hiragana_break, segment_in_parallel, update_in_background, wait_for_update
+from rope import Rope
+from segmenter import is_character_boundary
 
 
 LOGGER = logging.getLogger(__name__)
@@ -39,6 +45,8 @@ HIRAGANA = ('あいうえおかきくけこさしすせそたちつてとなに
             'ゔがぎぐげござじずぜぞだぢづでどばびぶべぼぁぃぅぇぉゃゅょっぱぴぷぺぽゎゐゑ・ーゝゞ')
 KATAKANA = ('アイウエオカキクケコサシスセソタチツテトナニヌネノハヒフヘホマミムメモヤユヨラリルレロワヲン'
             'ヴガギグゲゴザジズゼゾダヂヅデドバビブベボァィゥェォャュョッパピプペポヮヰヱ・ーヽヾ')
+ANNOTATIONS = re.compile('([\uFFF9\uFFFA\uFFFB])')
+WELL_FORMED = re.compile('[^\uFFF9-\uFFFB]*(?:\uFFF9[^\uFFF9-\uFFFB]*\uFFFA[^\uFFF9-\uFFFB]*\uFFFB[^\uFFF9-\uFFFB]*)*')
 KANZI = re.compile(r'[\u4E00-\u9FFF\uFA0E-\uFA2D\uFA30-\uFA6A\uFA6B-\uFA6D𠮟]+')
 
 PLAIN = 0
@@ -48,6 +56,23 @@ RUBY = 2
 MAX_PRECIDING_TEXT = 512
 MAX_SURROUNDING_TEXT = 1024
 
+# Texts longer than PARALLEL_SEGMENTATION are segmented in worker processes.
+PARALLEL_SEGMENTATION = 262144
+
+# Paragraphs of GIANT_PARAGRAPH characters or more are kept in chunks of about
+# CHUNK_SIZE characters that end with sentences, so that an edit analyzes and
+# segments only the chunks it touches. Chunked paragraphs shorter than
+# GIANT_PARAGRAPH / 2 are joined again. Chunks end where lines can break, so
+# that they wrap as a single paragraph would.
+GIANT_PARAGRAPH = 32768
+CHUNK_SIZE = 4096
+CHUNK_END = re.compile('[。．？！]+[」』）］】〕〉》’”]*|[ \t　]+')
+# Characters that do not begin a line
+NO_BREAK_BEFORE = '。．？！」』）］】〕〉》’”、，・：；ー々ゝゞヽヾぁぃぅぇぉっゃゅょゎゕゖァィゥェォッャュョヮヵヶ'
+
+# Paragraph.revision is unique to each text of a paragraph.
+_revisions = count(1)
+
 
 def is_reading(s):
     if not s:
@@ -64,31 +89,34 @@ def is_reading(s):
 
 def get_plain_text(s):
     mode = PLAIN
-    plain = ''
-    for c in s:
-        if c == IAA:
+    plain = []
+    for t in ANNOTATIONS.split(s):
+        if t == IAA:
             mode = BASE
-        elif c == IAS:
+        elif t == IAS:
             mode = RUBY
-        elif c == IAT:
+        elif t == IAT:
             mode = PLAIN
         elif mode != RUBY:
-            plain += c
-    return plain
+            plain.append(t)
+    return ''.join(plain)
 
 
-def has_newline(s):
-    for c in s:
-        if c in NEWLINES:
-            return True
-    return False
+def _split_annotations(s):
+    i = 0
+    for m in ANNOTATIONS.finditer(s):
+        yield s[i:m.start()]
+        yield m.group()
+        i = m.end()
+    yield s[i:]
 
 
 def remove_dangling_annotations(s):
-    t = ''
+    # s is processed in runs of text between the annotation characters.
+    t = []
     i = 0
     mode = PLAIN
-    for c in s:
+    for c in _split_annotations(s):
         if c == IAA:
             if mode != PLAIN:
                 continue
@@ -97,40 +125,83 @@ def remove_dangling_annotations(s):
             mode = RUBY
         elif c == IAT:
             if mode != RUBY:
-                t = ''
+                t.clear()
             i = i + 1
             break
         elif mode == PLAIN:
-            t += c
-        i += 1
+            t.append(c)
+        i += len(c)
     mode = PLAIN
     s = s[i:]
-    a = ''
-    for c in s:
+    if WELL_FORMED.fullmatch(s):
+        t.append(s)
+        return ''.join(t)
+    a = []
+    for c in ANNOTATIONS.split(s):
         if c == IAA:
             if mode != PLAIN:
                 continue
             mode = BASE
-            a += c
+            a.append(c)
         elif c == IAS:
             if mode != BASE:
                 continue
             mode = RUBY
-            a += c
+            a.append(c)
         elif c == IAT:
             if mode != RUBY:
                 continue
             mode = PLAIN
-            a += c
-            t += a
-            a = ''
+            a.append(c)
+            t.extend(a)
+            a.clear()
         elif mode == PLAIN:
-            t += c
+            t.append(c)
         else:
-            a += c
+            a.append(c)
     if mode != PLAIN:
-        t += remove_dangling_annotations(a[1:])
-    return t
+        t.append(remove_dangling_annotations(''.join(a)[1:]))
+    return ''.join(t)
+
+
+def _is_outside_annotations(text, start, end):
+    # start must be outside annotations.
+    i = max(text.rfind(IAA, start, end), text.rfind(IAS, start, end), text.rfind(IAT, start, end))
+    return i < 0 or text[i] == IAT
+
+
+def _is_chunk_end(text, start, end):
+    # Returns True if the chunk beginning at start can end at end, where
+    # extended grapheme clusters are broken outside annotations.
+    return is_character_boundary(text, end) and _is_outside_annotations(text, start, end)
+
+
+def _find_chunk_end(text, start):
+    pos = start + CHUNK_SIZE
+    for m in CHUNK_END.finditer(text, pos, pos + CHUNK_SIZE):
+        end = m.end()
+        if _is_chunk_end(text, start, end) and (end == len(text) or text[end] not in NO_BREAK_BEFORE):
+            return end
+    # Cut a text without sentences or spaces anywhere characters are broken.
+    end = pos + CHUNK_SIZE
+    while end < len(text) and not _is_chunk_end(text, start, end):
+        if _is_outside_annotations(text, start, end):
+            end += 1
+        else:
+            end = text.find(IAT, end) + 1 or len(text)
+    return end
+
+
+def _split_chunks(text):
+    chunks = []
+    start = 0
+    while start + 2 * CHUNK_SIZE < len(text):
+        end = _find_chunk_end(text, start)
+        chunks.append(text[start:end])
+        start = end
+    if start < len(text) or not chunks:
+        chunks.append(text[start:])
+    return chunks
 
 
 class Paragraph:
@@ -139,42 +210,94 @@ class Paragraph:
         self.text = ''
         self.plain = ''
         self.rubies = []
-        self.breaker = Breaker()
+        self.revision = 0
+        # Offset tables from raw offsets to plain offsets, from plain offsets
+        # to raw offsets, and from plain offsets to UTF-8 indices. None if
+        # the offsets are the same.
+        self.plain_offsets = None
+        self.raw_offsets = None
+        self.indices = None
+        # Sorted offsets of the annotation characters
+        self.annotations = array('I')
+        # The Breaker is created on the first cursor or word query.
+        self.breaker = None
+        # (future, index) of the boundaries being computed by segment_in_parallel()
+        self.pending = None
+        # The future of the Breaker update running in the worker thread
+        self.updating = None
+        # The chunks of a giant paragraph as Paragraph objects, which are
+        # replaced rather than modified, and the raw offsets, the plain
+        # offsets and the UTF-8 indices where the chunks begin followed by
+        # the lengths. The offset tables, the annotations, the rubies and
+        # the Breaker of a giant paragraph are those of its chunks.
+        self.chunks = None
+        self.chunk_starts = None
+        self.chunk_plain_starts = None
+        self.chunk_index_starts = None
         self.set_text(text)
 
     def _backward_cursor_position(self, offset):
         assert 0 <= offset <= len(self.text)
-        return self.breaker.preceding(offset)
+        if self.chunks is not None:
+            k, offset = self._find_preceding_chunk(offset)
+            return self.chunk_starts[k] + self.chunks[k]._backward_cursor_position(offset)
+        return self._get_breaker().preceding(offset)
 
     def _backward_visible_word_start(self, offset):
         assert 0 <= offset <= len(self.text)
-        return self.breaker.preceding_word_start(offset)
+        if self.chunks is not None:
+            k, offset = self._find_preceding_chunk(offset)
+            offset = self.chunks[k]._backward_visible_word_start(offset)
+            # The Breaker of a chunk begins a word at the chunk start.
+            while 0 < k and offset == 0 and not self._is_word_start(self.chunk_starts[k]):
+                k -= 1
+                offset = self.chunks[k]._backward_visible_word_start(len(self.chunks[k].text))
+            return self.chunk_starts[k] + offset
+        return self._get_breaker().preceding_word_start(offset)
 
     def _expand_plain_offset(self, offset):
-        mode = PLAIN
-        i = 0
-        length = 0
-        for c in self.text:
-            if length == offset:
-                if i < len(self.text) and self.text[i] == IAS:
-                    i = self.text.find(IAT, i + 1) + 1
-                break
-            if c == IAA:
-                mode = BASE
-            elif c == IAS:
-                mode = RUBY
-            elif c == IAT:
-                mode = PLAIN
-            elif mode == RUBY:
-                pass
-            else:
-                length += 1
-            i += 1
-        return i
+        if self.chunks is not None:
+            # Use the chunk before offset, which may end with annotations.
+            k = max(0, min(len(self.chunks) - 1, bisect_left(self.chunk_plain_starts, offset) - 1))
+            return self.chunk_starts[k] + self.chunks[k]._expand_plain_offset(offset - self.chunk_plain_starts[k])
+        if self.raw_offsets is None:
+            return min(offset, len(self.text))
+        if offset < len(self.raw_offsets):
+            return self.raw_offsets[offset]
+        return len(self.text)
+
+    def _find_annotation(self, offset):
+        # Returns the offset of the first annotation character at or after
+        # offset, or -1 if there is none.
+        if self.chunks is not None:
+            for k in range(self._find_chunk(self.chunk_starts, offset), len(self.chunks)):
+                i = self.chunks[k]._find_annotation(offset - self.chunk_starts[k])
+                if 0 <= i:
+                    return self.chunk_starts[k] + i
+            return -1
+        i = bisect_left(self.annotations, offset)
+        if i < len(self.annotations):
+            return self.annotations[i]
+        return -1
+
+    def _find_chunk(self, starts, offset):
+        # Returns the number of the chunk that contains offset in starts.
+        return max(0, min(len(self.chunks) - 1, bisect_right(starts, offset) - 1))
+
+    def _find_preceding_chunk(self, offset):
+        # Returns the number of the chunk that contains the character before
+        # the raw offset, and the offset within the chunk.
+        k = self._find_chunk(self.chunk_starts, offset)
+        if 0 < k and offset == self.chunk_starts[k]:
+            k -= 1
+        return k, offset - self.chunk_starts[k]
 
     def _forward_cursor_position(self, offset):
         assert 0 <= offset <= len(self.text)
-        return self.breaker.following(offset)
+        if self.chunks is not None:
+            k = self._find_chunk(self.chunk_starts, offset)
+            return self.chunk_starts[k] + self.chunks[k]._forward_cursor_position(offset - self.chunk_starts[k])
+        return self._get_breaker().following(offset)
 
     def _forward_search(self, offset, sub, flags):
         plain = self.get_plain_text()
@@ -188,38 +311,91 @@ class Paragraph:
 
     def _forward_visible_word_end(self, offset):
         assert 0 <= offset <= len(self.text)
-        return self.breaker.following_word_end(offset)
+        if self.chunks is not None:
+            k = self._find_chunk(self.chunk_starts, offset)
+            offset = self.chunks[k]._forward_visible_word_end(offset - self.chunk_starts[k])
+            # The Breaker of a chunk ends a word at the chunk end.
+            last = len(self.chunks) - 1
+            while k < last and offset == len(self.chunks[k].text) and not self._is_word_end(self.chunk_starts[k + 1]):
+                k += 1
+                offset = self.chunks[k]._forward_visible_word_end(0)
+            return self.chunk_starts[k] + offset
+        return self._get_breaker().following_word_end(offset)
+
+    def _get_breaker(self):
+        if self.updating:
+            wait_for_update(self.updating)
+            self.updating = None
+        if self.breaker is None:
+            self.breaker = Breaker()
+            if self.pending:
+                future, index = self.pending
+                self.pending = None
+                try:
+                    self.breaker.set_boundaries(self.text, future.result()[index], self.annotations)
+                    return self.breaker
+                except Exception:
+                    LOGGER.exception('Could not segment text in parallel')
+            self.breaker.set_text(self.text, self.annotations)
+        return self.breaker
+
+    def _get_plain_index(self, offset):
+        # Returns the UTF-8 index of the plain offset for Pango.
+        if self.chunks is not None:
+            k = self._find_chunk(self.chunk_plain_starts, offset)
+            return self.chunk_index_starts[k] + self.chunks[k]._get_plain_index(offset - self.chunk_plain_starts[k])
+        if self.indices is None:
+            if self.plain.isascii():
+                return offset
+            self.indices = array('I', accumulate(map(len, map(str.encode, self.plain)), initial=0))
+        return self.indices[offset]
 
     def _get_plain_offset(self, offset):
-        mode = PLAIN
-        i = 0
-        pos = 0
-        for c in self.text:
-            if i == offset:
-                break
-            if c == IAA:
-                mode = BASE
-            elif c == IAS:
-                mode = RUBY
-            elif c == IAT:
-                mode = PLAIN
-            elif mode == RUBY:
-                pass
-            else:
-                pos += 1
-            i += 1
-        return pos
+        offset = min(offset, len(self.text))
+        if self.chunks is not None:
+            k = self._find_chunk(self.chunk_starts, offset)
+            return self.chunk_plain_starts[k] + self.chunks[k]._get_plain_offset(offset - self.chunk_starts[k])
+        if self.plain_offsets is None:
+            return offset
+        return self.plain_offsets[offset]
+
+    def _get_plain_offset_from_index(self, index):
+        if self.chunks is not None:
+            k = self._find_chunk(self.chunk_index_starts, index)
+            offset = self.chunks[k]._get_plain_offset_from_index(index - self.chunk_index_starts[k])
+            return self.chunk_plain_starts[k] + offset
+        if self.indices is None:
+            if self.plain.isascii():
+                return min(index, len(self.plain))
+            self._get_plain_index(0)
+        return bisect_right(self.indices, index) - 1
 
     def _inside_ruby(self, offset):
         assert offset < self.get_length()
-        for c in self.text[offset:]:
-            if c == IAA:
-                return False
-            elif c == IAS:
-                return True
-            elif c == IAT:
-                return True
-        return False
+        i = self._find_annotation(offset)
+        return 0 <= i and self.text[i] != IAA
+
+    def _is_word_end(self, offset):
+        # Returns True if a word can end at offset as in Breaker.
+        return not self.text[offset - 1].isspace() and not is_hiragana_break(self.text, offset)
+
+    def _is_word_start(self, offset):
+        # Returns True if a word can start at offset as in Breaker.
+        return not self.text[offset].isspace() and not is_hiragana_break(self.text, offset)
+
+    def _rfind_annotation(self, offset):
+        # Returns the offset of the last annotation character before offset,
+        # or -1 if there is none.
+        if self.chunks is not None:
+            for k in range(self._find_chunk(self.chunk_starts, offset), -1, -1):
+                i = self.chunks[k]._rfind_annotation(offset - self.chunk_starts[k])
+                if 0 <= i:
+                    return self.chunk_starts[k] + i
+            return -1
+        i = bisect_left(self.annotations, offset)
+        if 0 < i:
+            return self.annotations[i - 1]
+        return -1
 
     def get_length(self):
         # plus one as a newline at the end of the line
@@ -229,30 +405,135 @@ class Paragraph:
         # plus one as a newline at the end of the line
         return len(self.get_plain_text()) + 1
 
+    def copy(self):
+        paragraph = Paragraph()
+        paragraph.text = self.text
+        paragraph.plain = self.plain
+        paragraph.revision = self.revision
+        paragraph.rubies = [ruby.copy() for ruby in self.rubies]
+        paragraph.plain_offsets = self.plain_offsets
+        paragraph.raw_offsets = self.raw_offsets
+        paragraph.indices = self.indices
+        paragraph.annotations = self.annotations
+        if self.chunks is not None:
+            paragraph.chunks = list(self.chunks)
+            paragraph.chunk_starts = self.chunk_starts
+            paragraph.chunk_plain_starts = self.chunk_plain_starts
+            paragraph.chunk_index_starts = self.chunk_index_starts
+        if self.breaker:
+            paragraph.breaker = self._get_breaker().copy()
+        paragraph.pending = self.pending
+        return paragraph
+
+    def delete(self, start, end):
+        self.replace(start, end, '')
+
     def _get_plain_text(self):
-        self.plain = ''
         self.rubies.clear()
+        self.indices = None
+        self.chunks = None
+        chunks = _split_chunks(self.text) if GIANT_PARAGRAPH <= len(self.text) else ()
+        if 1 < len(chunks):
+            self.chunks = [Paragraph(chunk) for chunk in chunks]
+            self._join_chunks()
+            return self.plain
+        if IAA not in self.text and IAS not in self.text and IAT not in self.text:
+            self.plain = self.text
+            self.plain_offsets = self.raw_offsets = None
+            self.annotations = array('I')
+            return self.plain
+        plain = []
+        plain_offsets = array('I')
+        raw_offsets = array('I', [0])
+        annotations = array('I')
         mode = PLAIN
         i = pos = length = 0
         ruby = ''
-        for c in self.text:
-            if c == IAA:
+        offset = last = 0   # raw offsets of s and the end of the last plain text
+        separators = []     # plain offsets whose raw offsets are at IAS
+        for s in ANNOTATIONS.split(self.text):
+            if not s:
+                continue
+            if s == IAA:
                 mode = BASE
                 pos = i
-            elif c == IAS:
+            elif s == IAS:
                 mode = RUBY
                 length = i - pos
-            elif c == IAT:
+                if last == offset:
+                    separators.append(i)
+            elif s == IAT:
                 mode = PLAIN
                 self.rubies.append([pos, length, ruby])
                 ruby = ''
+                # Move the plain offsets after the annotation.
+                for separator in separators:
+                    raw_offsets[separator] = offset + 1
+                separators.clear()
             elif mode == RUBY:
-                ruby += c
+                ruby += s
+                plain_offsets.extend(array('I', [i]) * len(s))
+                offset += len(s)
+                continue
             else:
-                self.plain += c
-                i += 1
+                plain.append(s)
+                plain_offsets.extend(range(i, i + len(s)))
+                raw_offsets.extend(range(offset + 1, offset + len(s) + 1))
+                i += len(s)
+                offset += len(s)
+                last = offset
+                continue
+            plain_offsets.append(i)
+            annotations.append(offset)
+            offset += 1
+        plain_offsets.append(i)
+        for separator in separators:
+            raw_offsets[separator] = 0
+        self.plain = ''.join(plain)
+        self.plain_offsets = plain_offsets
+        self.raw_offsets = raw_offsets
+        self.annotations = annotations
         return self.plain
 
+    def _join_chunks(self):
+        self.chunk_starts = list(accumulate((len(chunk.text) for chunk in self.chunks), initial=0))
+        self.chunk_plain_starts = list(accumulate((len(chunk.plain) for chunk in self.chunks), initial=0))
+        self.chunk_index_starts = list(accumulate((chunk._get_plain_index(len(chunk.plain)) for chunk in self.chunks),
+                                                  initial=0))
+        self.plain = ''.join(chunk.plain for chunk in self.chunks)
+        self.plain_offsets = self.raw_offsets = self.indices = None
+        self.annotations = array('I')
+        # The Breakers of the chunks segment the text.
+        self.breaker = None
+        self.pending = None
+        self.updating = None
+
+    def _replace_chunks(self, start, end, length):
+        # Splits again the chunks from the one containing start to the one
+        # containing end, in which the text from start to end has been
+        # replaced with length characters.
+        first = self._find_chunk(self.chunk_starts, start)
+        last = self._find_chunk(self.chunk_starts, max(start, end - 1))
+        delta = length - (end - start)
+        while 0 < first and not _is_chunk_end(self.text, self.chunk_starts[first - 1], self.chunk_starts[first]):
+            # The edit combined characters with the previous chunk.
+            first -= 1
+        while True:
+            begin = self.chunk_starts[first]
+            stop = self.chunk_starts[last + 1] + delta
+            if last + 1 < len(self.chunks) and stop - begin < CHUNK_SIZE:
+                # Join the short chunks with the next one.
+                last += 1
+                continue
+            chunks = _split_chunks(self.text[begin:stop])
+            if last + 1 == len(self.chunks) or _is_chunk_end(self.text, stop - len(chunks[-1]), stop):
+                break
+            # The edit left an annotation open, or combined characters with
+            # the next chunk.
+            last += 1
+        self.chunks[first:last + 1] = [Paragraph(chunk) for chunk in chunks]
+        self._join_chunks()
+
     def get_plain_text(self):
         return self.plain
 
@@ -260,18 +541,41 @@ class Paragraph:
         return self.text
 
     def insert(self, offset, text):
-        assert offset <= len(self.text)
-        self.set_text(self.text[:offset] + text + self.text[offset:])
+        self.replace(offset, offset, text)
+
+    def replace(self, start, end, text):
+        # Replaces the text from start to end with text. The paragraph text
+        # is kept as a single string, so each edit copies it in O(length of
+        # the paragraph) at the speed of a memory copy. The offset tables
+        # and the rubies are rebuilt in O(length) as well, except that a
+        # giant paragraph analyzes again only the chunks the edit touches.
+        assert start <= len(self.text)
+        if start != end or text:
+            if self.pending and self.pending[0].done():
+                self._get_breaker()
+            self.pending = None
+            self.text = self.text[:start] + text + self.text[end:]
+            self.revision = next(_revisions)
+            if self.chunks is not None and GIANT_PARAGRAPH // 2 <= len(self.text):
+                self._replace_chunks(start, end, len(text))
+            else:
+                self._get_plain_text()
+            if self.breaker:
+                self.updating = update_in_background(self.breaker, self.text, start, end, len(text), self.annotations)
 
     def set_text(self, text):
         self.text = text
+        self.revision = next(_revisions)
         self._get_plain_text()
-        self.breaker = Breaker(self.text)
+        self.breaker = None
+        self.pending = None
+        self.updating = None
 
     def split(self, offset):
         assert offset <= len(self.text)
-        cont = Paragraph(self.text[offset:])
-        self.set_text(self.text[:offset])
+        cont = self.copy()
+        cont.delete(0, offset)
+        self.delete(offset, len(self.text))
         return cont
 
 
@@ -466,6 +770,8 @@ class FuriganaBuffer(GObject.Object):
         'delete-range': (GObject.SIGNAL_RUN_LAST, None, (object, object, )),
         'end-user-action': (GObject.SIGNAL_RUN_FIRST, None, ()),
         'insert-text': (GObject.SIGNAL_RUN_LAST, None, (object, str, )),
+        # first line, number of lines removed, number of lines added
+        'lines-changed': (GObject.SIGNAL_RUN_LAST, None, (int, int, int, )),
         'mark-set': (GObject.SIGNAL_RUN_LAST, None, (object, object, )),
         'modified-changed': (GObject.SIGNAL_RUN_LAST, None, ()),
         'redo': (GObject.SIGNAL_RUN_LAST, None, ()),
@@ -475,7 +781,7 @@ class FuriganaBuffer(GObject.Object):
     def __init__(self):
         super().__init__()
         self.marks = {}
-        self.paragraphs = []
+        self.paragraphs = Rope()
         self.annotated = ''
         self.ruby_mode = True
 
@@ -641,24 +947,16 @@ class FuriganaBuffer(GObject.Object):
 
         # Check annotation before 'start'
         self.annotated = ''
-        cursor = start.copy()
-        text = self.paragraphs[start.get_line()].get_text()
+        paragraph = self.paragraphs[start.get_line()]
+        text = paragraph.get_text()
         offset = pos = start.get_line_offset()
         d = ''
-        i = 0
-        for c in text[pos:]:
-            if c == IAA:
-                break
-            elif c == IAS:
+        i = paragraph._find_annotation(pos)
+        if 0 <= i and (start.get_line() < end.get_line() or i < end.get_line_offset()):
+            if text[i] == IAS:
                 d = IAA
-                break
-            elif c == IAT:
+            elif text[i] == IAT:
                 d = IAS
-                break
-            i += 1
-            cursor.set_line_offset(pos + i)
-            if end <= cursor:
-                break
         if d == IAS:
             pos = text.rfind(IAS, 0, pos)
             d = IAA
@@ -668,24 +966,16 @@ class FuriganaBuffer(GObject.Object):
         start.set_line_offset(offset)
 
         # Check annotation after 'end'
-        cursor = end.copy()
-        text = self.paragraphs[end.get_line()].get_text()
+        paragraph = self.paragraphs[end.get_line()]
+        text = paragraph.get_text()
         offset = pos = end.get_line_offset()
         d = ''
-        i = 0
-        for c in reversed(text[:pos]):
-            if c == IAA:
+        i = paragraph._rfind_annotation(pos)
+        if 0 <= i and (start.get_line() < end.get_line() or start.get_line_offset() <= i):
+            if text[i] == IAA:
                 d = IAS
-                break
-            elif c == IAS:
+            elif text[i] == IAS:
                 d = IAT
-                break
-            elif c == IAT:
-                break
-            i -= 1
-            cursor.set_line_offset(pos + i)
-            if cursor <= start:
-                break
         if d == IAS:
             offset = text.find(IAS, pos)
             self.annotated += text[pos:offset]
@@ -732,23 +1022,19 @@ class FuriganaBuffer(GObject.Object):
 
     def do_delete_range(self, start, end):
         if start.get_line() == end.get_line():
-            text = self.paragraphs[start.get_line()].get_text()
-            text = text[:start.get_line_offset()] + text[end.get_line_offset():]
-            self.paragraphs[start.get_line()].set_text(text)
+            self.paragraphs[start.get_line()].delete(start.get_line_offset(), end.get_line_offset())
             end.set_line_offset(start.get_line_offset())
+            self.emit('lines-changed', start.get_line(), 1, 1)
         else:
-            lineno = end.get_line()
-            if start.get_line() + 1 < lineno:
-                del self.paragraphs[start.get_line() + 1:lineno]
-                lineno = start.get_line() + 1
-
-            text = self.paragraphs[lineno].get_text()[end.get_line_offset():]
-            del self.paragraphs[lineno]
-            lineno -= 1
-            text = self.paragraphs[lineno].get_text()[:start.get_line_offset()] + text
-            self.paragraphs[lineno].set_text(text)
+            lineno = start.get_line()
+            removed = end.get_line() - lineno + 1
+            text = self.paragraphs[end.get_line()].get_text()[end.get_line_offset():]
+            del self.paragraphs[lineno + 1:end.get_line() + 1]
+            paragraph = self.paragraphs[lineno]
+            paragraph.replace(start.get_line_offset(), len(paragraph.get_text()), text)
             end.set_line(lineno)
             end.set_line_offset(start.get_line_offset())
+            self.emit('lines-changed', lineno, removed, 1)
 
         # Insert annotated text again without the annotation
         if self.annotated:
@@ -762,33 +1048,27 @@ class FuriganaBuffer(GObject.Object):
         if 1 == len(lines) and lines[0][-1] not in NEWLINES:
             self.paragraphs[lineno].insert(iter.get_line_offset(), text)
             iter.set_line_offset(iter.get_line_offset() + len(text))
+            self.emit('lines-changed', lineno, 1, 1)
             return
 
         cont = self.paragraphs[lineno].split(iter.get_line_offset())
-        if lineno == self.get_line_count() - 1:
-            self.paragraphs.append(cont)
-        else:
-            self.paragraphs.insert(lineno + 1, cont)
-
         text = lines[0].rstrip(NEWLINES)
         self.paragraphs[lineno].insert(iter.get_line_offset(), text)
         lines.pop(0)
-        if not lines:
-            iter.set_line(lineno + 1)
-            iter.set_line_offset(0)
-            return
 
+        # Insert all the new paragraphs at once rather than one by one.
+        paragraphs = []
+        iter.set_line_offset(0)
         for s in lines:
-            lineno += 1
             if s[-1] not in NEWLINES:
-                self.paragraphs[lineno].insert(0, s)
-                iter.set_line(lineno)
+                cont.insert(0, s)
                 iter.set_line_offset(len(s))
-                return
-            p = Paragraph(s.rstrip(NEWLINES))
-            self.paragraphs.insert(lineno, p)
-        iter.set_line(lineno + 1)
-        iter.set_line_offset(0)
+                break
+            paragraphs.append(Paragraph(s.rstrip(NEWLINES)))
+        paragraphs.append(cont)
+        self.paragraphs[lineno + 1:lineno + 1] = paragraphs
+        iter.set_line(lineno + len(paragraphs))
+        self.emit('lines-changed', lineno, 1, 1 + len(paragraphs))
 
     def do_redo(self):
         if not self.redo:
@@ -943,27 +1223,26 @@ class FuriganaBuffer(GObject.Object):
                 e = self._get_plain_line_offset(end)
                 return self.paragraphs[line].get_plain_text()[s:e]
         assert start < end
-        text = ''
         if include_hidden_chars:
-            text += self.paragraphs[line].get_text()[start.get_line_offset():] + '\n'
+            text = [self.paragraphs[line].get_text()[start.get_line_offset():]]
         else:
             offset = self._get_plain_line_offset(start)
-            text += self.paragraphs[line].get_plain_text()[offset:] + '\n'
-        line += 1
-        while line < end.get_line():
+            text = [self.paragraphs[line].get_plain_text()[offset:]]
+        for paragraph in self.paragraphs[line + 1:end.get_line()]:
             if include_hidden_chars:
-                text += self.paragraphs[line].get_text() + '\n'
+                text.append(paragraph.get_text())
             else:
-                text += self.paragraphs[line].get_plain_text() + '\n'
-            line += 1
-        assert line == end.get_line()
+                text.append(paragraph.get_plain_text())
+        line = end.get_line()
         if line < self.get_line_count():
             if include_hidden_chars:
-                text += self.paragraphs[line].get_text()[:end.get_line_offset()]
+                text.append(self.paragraphs[line].get_text()[:end.get_line_offset()])
             else:
                 offset = self._get_plain_line_offset(end)
-                text += self.paragraphs[line].get_plain_text()[:offset]
-        return text
+                text.append(self.paragraphs[line].get_plain_text()[:offset])
+        else:
+            text.append('')
+        return '\n'.join(text)
 
     def insert(self, iter, text):
         LOGGER.debug(f'insert: "{text}"')
@@ -1049,31 +1328,42 @@ class FuriganaBuffer(GObject.Object):
     def set_ruby_mode(self, ruby):
         self.ruby_mode = ruby
 
+    def segment(self):
+        paragraphs = [paragraph for paragraph in self.paragraphs
+                      if paragraph.breaker is None and not paragraph.pending and paragraph.text and
+                      paragraph.chunks is None]
+        texts = [paragraph.text for paragraph in paragraphs]
+        for paragraph, pending in zip(paragraphs, segment_in_parallel(texts)):
+            paragraph.pending = pending
+
     def set_text(self, text):
         start, end = self.get_bounds()
         self.delete(start, end)
         self.insert(start, text)
         iter = self.get_start_iter()
         self.place_cursor(iter)
+        if PARALLEL_SEGMENTATION <= len(text) and 1 < (os.cpu_count() or 1):
+            self.segment()
 
     def unconvert(self, iter):
-        text = self.paragraphs[iter.get_line()].get_text()
+        paragraph = self.paragraphs[iter.get_line()]
+        text = paragraph.get_text()
         pos = iter.get_line_offset()
         if pos < 5 or text[pos - 1] != IAT:
             return False
-        mode = IAT
-        ruby = ''
-        size = 1
-        for c in reversed(text[:pos - 1]):
-            size += 1
-            if c == IAA:
-                start = iter.copy()
-                start.set_line_offset(pos - size)
-                self.delete(start, iter)
-                self.insert(iter, ruby)
-                return True
-            elif c == IAS:
-                mode = IAS
-            elif mode == IAT:
-                ruby = c + ruby
-        return False
+        separator = pos - 1
+        i = paragraph._rfind_annotation(pos - 1)
+        while 0 <= i and text[i] != IAA:
+            if text[i] == IAS and separator == pos - 1:
+                separator = i
+            i = paragraph._rfind_annotation(i)
+        if i < 0:
+            return False
+        if separator == pos - 1:
+            separator = i
+        ruby = text[separator + 1:pos - 1]
+        start = iter.copy()
+        start.set_line_offset(i)
+        self.delete(start, iter)
+        self.insert(iter, ruby)
+        return True
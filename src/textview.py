@@ -18,28 +18,54 @@ import logging
 import math
 import os
 import re
+import time
+from bisect import bisect_right
+from itertools import count
 
 import cairo
 import gi
 gi.require_version('Gtk', '3.0')
 gi.require_version('Pango', '1.0')
 gi.require_version('PangoCairo', '1.0')
-from gi.repository import GObject, Gdk, Gtk, Pango, PangoCairo
-
-from textbuffer import (FuriganaBuffer, has_newline, remove_dangling_annotations,
+from gi.repository import GLib, GObject, Gdk, Gtk, Pango, PangoCairo
+
+from chunkedlayout import ChunkedLayout, get_line_end
+from heightindex import HeightIndex
+from lrucache import LRUCache
+from preeditlayout import PreeditLayout
+from resources import Resources
+from textbuffer import (FuriganaBuffer, remove_dangling_annotations,
                         IAA, IAS, IAT, KANZI, is_reading)
 
 
 LOGGER = logging.getLogger(__name__)
 
+# Serial numbers of the preedit texts that are unique among the views
+_preedit_serials = count(1)
+
 # A sentence with more than SENTENCE_SHORT characters is not short.
 SENTENCE_SHORT = 50
 # A sentence with more than SENTENCE_LONG characters is long.
 SENTENCE_LONG = 60
+# A sentence ends with a full stop, a question mark, an exclamation mark, or
+# before a space. Leading spaces and tabs are not a part of a sentence.
+SENTENCE = re.compile('[\t 　]*([^ 　。．？！]*[。．？！]?)')
 
 DEFAULT_FONT = 'Noto Sans Mono CJK JP 16px'
 RUBY_DIV = 2.75
 
+# Time in seconds to measure paragraphs at once while idle
+REFLOW_BUDGET = 0.008
+
+# Number of the layouts with the preedit text to keep
+PREEDIT_CACHE_SIZE = 2
+
+# Time in milliseconds to wait for the window size to settle before reflowing
+RESIZE_DELAY = 100
+
+# Number of the widths and fonts to keep the measured heights for
+WIDTH_CACHE_SIZE = 4
+
 ESCAPE = str.maketrans({
     '<': '&lt;',
     '>': '&gt;',
@@ -60,7 +86,7 @@ class FuriganaView(Gtk.DrawingArea, Gtk.Scrollable):
         'undo': (GObject.SIGNAL_ACTION | GObject.SIGNAL_RUN_LAST, None, ()),
     }
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, resources=None, **kwargs):
         super().__init__(*args, **kwargs)
 
         display = Gdk.Display.get_default()
@@ -80,9 +106,32 @@ class FuriganaView(Gtk.DrawingArea, Gtk.Scrollable):
         self.width = 1
         self.height = 0
         self.caret = Gdk.Rectangle()
-        self.heights = []
+        # lines of the cursor and the selection bound drawn last, and whether text was selected
+        self.drawn_cursor = None
+        self.heights = HeightIndex()
+        # 1 for each paragraph whose height is estimated and not measured yet
+        self.estimated = bytearray()
+        self.reflow_next = 0
+        self.reflow_source = 0
+        self.resize_source = 0
+        # The measured heights by paragraph revision for each width and font
+        self.saved_heights = LRUCache(WIDTH_CACHE_SIZE)
+        self.heights_key = None
+        # The caches may be shared with the other views of the application.
+        self.resources = resources if resources else Resources()
+        self.layouts = self.resources.layouts
+        self.rubies = self.resources.rubies
+        # The layouts and the rubies of the paragraph being composed are
+        # kept apart so that composing does not evict the others.
+        self.preedit_layouts = LRUCache(PREEDIT_CACHE_SIZE)
+        self.preedit_rubies = LRUCache(PREEDIT_CACHE_SIZE)
+        self.sentences = self.resources.sentences
+        self.line_boxes = self.resources.line_boxes
+        self.surfaces = self.resources.surfaces
+        self.chunk_layouts = self.resources.chunk_layouts
+        self.chunk_rubies = self.resources.chunk_rubies
+        self.prerender_source = 0
         self.highlight_sentences = True
-        self.reflow_line = -1  # line number to reflow after "delete-range"; -1 to reflow every line
         self.click_count = 0
         self.anchor = self.buffer.create_mark('anchor', self.buffer.get_start_iter())
 
@@ -92,11 +141,13 @@ class FuriganaView(Gtk.DrawingArea, Gtk.Scrollable):
         style = self.get_style_context()
         self.padding = style.get_padding(Gtk.StateFlags.NORMAL)
 
-        self.buffer.connect_after('insert-text', self.on_inserted)
-        self.buffer.connect('delete-range', self.on_delete)
-        self.buffer.connect_after('delete-range', self.on_deleted)
+        self.buffer.connect('lines-changed', self.on_lines_changed)
 
         self.connect('configure-event', self.on_configure)
+        # The resolution, the font options and the scale factor may change.
+        self.connect('screen-changed', self.on_context_changed)
+        self.connect('style-updated', self.on_context_changed)
+        self.connect('notify::scale-factor', self.on_context_changed)
         self.connect('draw', self.on_draw)
         self.connect('key-press-event', self.on_key_press)
         self.connect('key-release-event', self.on_key_release)
@@ -117,11 +168,9 @@ class FuriganaView(Gtk.DrawingArea, Gtk.Scrollable):
         desc = Pango.font_description_from_string(DEFAULT_FONT)
         self.set_font(desc)
 
-    def _draw_caret(self, cr, layout, current, y, offset):
+    def _draw_caret(self, cr, layout, index, y):
         cr.save()
-        st, we = layout.get_cursor_pos(len(current[:offset].encode()))
-        self.caret.x, self.caret.y, self.caret.width, self.caret.height = \
-            st.x / Pango.SCALE - 1, y + st.y / Pango.SCALE, st.width / Pango.SCALE + 2, st.height / Pango.SCALE
+        self.caret = self._get_caret(layout, index, y)
         if (1, 13) <= cairo.version_info:
             cr.set_operator(cairo.Operator.DIFFERENCE)
             cr.set_source_rgb(1, 1, 1)
@@ -133,67 +182,578 @@ class FuriganaView(Gtk.DrawingArea, Gtk.Scrollable):
         self.im.set_cursor_location(im_caret)
         cr.restore()
 
-    def _draw_rubies(self, cr, layout, paragraph, plain, height, cursor_offset, current_line):
-        lt = PangoCairo.create_layout(cr)
-        desc = self.get_font().copy_static()
-        size = desc.get_size()
-        desc.set_size(size // RUBY_DIV)
-        lt.set_font_description(desc)
+    def _draw_selection(self, cr, layout, selection, y):
+        # Draws the selection over the text, which has been drawn in black
+        # on white.
+        start, end = selection
+        if isinstance(layout, ChunkedLayout):
+            left, top, right, bottom = cr.clip_extents()
+            chunks = layout.get_chunks((top - y) * Pango.SCALE, (bottom - y) * Pango.SCALE)
+            for k in range(max(chunks.start, layout.find_chunk(start)), min(chunks.stop, layout.find_chunk(end) + 1)):
+                index = layout.indices[k]
+                self._draw_selection(cr, layout.layouts[k], (start - index, end - index),
+                                     y + layout.tops[k] / Pango.SCALE)
+            return
+        cr.save()
+        if (1, 13) <= cairo.version_info:
+            cr.set_operator(cairo.Operator.MULTIPLY)
+            cr.set_source_rgb(0xac / 0xff, 0xce / 0xff, 0xf7 / 0xff)
+        else:
+            cr.set_source_rgba(0xac / 0xff, 0xce / 0xff, 0xf7 / 0xff, 0.5)
+        iter = layout.get_iter()
+        while True:
+            line = iter.get_line_readonly()
+            if end <= line.start_index:
+                break
+            if start < line.start_index + line.length:
+                ink, logical = iter.get_line_extents()
+                ranges = line.get_x_ranges(start, end)
+                for i in range(0, len(ranges) - 1, 2):
+                    cr.rectangle(ranges[i] / Pango.SCALE, y + logical.y / Pango.SCALE,
+                                 (ranges[i + 1] - ranges[i]) / Pango.SCALE, logical.height / Pango.SCALE)
+            if not iter.next_line():
+                break
+        cr.fill()
+        cr.restore()
+
+    def _draw_paragraph(self, cr, line, y):
+        layout = self._get_layout(line)
+        if isinstance(layout, ChunkedLayout):
+            self._draw_chunks(cr, line, layout, y)
+            return
+        self._show_layout(cr, layout, y)
+        self._draw_rubies(cr, self._get_rubies(line), y)
+
+    def _draw_chunks(self, cr, line, layout, y):
+        # Draws the chunks of the giant paragraph at line in the clip with
+        # the rubies in the spacing above them.
+        paragraph = self.get_paragraph(line)
+        preedit_offset = self._get_preedit_offset(line)
+        left, top, right, bottom = cr.clip_extents()
+        for k in layout.get_chunks((top - y) * Pango.SCALE, (bottom - y + self.spacing) * Pango.SCALE):
+            chunk_y = y + layout.tops[k] / Pango.SCALE
+            self._show_layout(cr, layout.layouts[k], chunk_y)
+            offset = self._get_chunk_preedit_offset(paragraph, k, preedit_offset)
+            self._draw_rubies(cr, self._get_chunk_rubies(layout.chunks[k], layout.layouts[k], offset), chunk_y)
+
+    def _show_layout(self, cr, layout, y):
+        if isinstance(layout, PreeditLayout):
+            # Draw the committed text except the line with the preedit text,
+            # and then that line.
+            left, top, right, bottom = cr.clip_extents()
+            line_top = y + layout.top / Pango.SCALE
+            line_bottom = y + layout.bottom / Pango.SCALE
+            cr.save()
+            cr.rectangle(left, top, right - left, max(0, line_top - top))
+            cr.rectangle(left, line_bottom, right - left, max(0, bottom - line_bottom))
+            cr.clip()
+            cr.move_to(0, y)
+            PangoCairo.show_layout(cr, layout.layout)
+            cr.restore()
+            cr.move_to(0, y + layout.y / Pango.SCALE)
+            PangoCairo.show_layout(cr, layout.line_layout)
+            return
+        cr.move_to(0, y)
+        PangoCairo.show_layout(cr, layout)
+
+    def _draw_rubies(self, cr, runs, height):
+        for x, y, lt in runs:
+            cr.move_to(x, height + y)
+            PangoCairo.show_layout(cr, lt)
+
+    def _create_layout(self):
+        layout = Pango.Layout(self.get_pango_context())
+        layout.set_font_description(self.get_font())
+        layout.set_width(self.width * Pango.SCALE)
+        layout.set_spacing(self.spacing * Pango.SCALE)
+        return layout
+
+    def _get_caret(self, layout, index, y):
+        st, we = layout.get_cursor_pos(index)
+        caret = Gdk.Rectangle()
+        caret.x, caret.y, caret.width, caret.height = \
+            st.x / Pango.SCALE - 1, y + st.y / Pango.SCALE, st.width / Pango.SCALE + 2, st.height / Pango.SCALE
+        return caret
+
+    def _get_line_boxes(self, line):
+        # Returns the layout of the committed text of the paragraph at line,
+        # the tops of its lines, the bottom of the last line and the layout
+        # lines, so that a point is looked up as layout.xy_to_index() does
+        # without going through the lines. Line boxes are shared with the
+        # other views and cached by the same keys as the layouts. The
+        # paragraph being composed is looked up with its layout instead.
+        paragraph = self.get_paragraph(line)
+        key = self._get_layout_key(paragraph, -1)
+        boxes = self.line_boxes.get(key)
+        if boxes is None:
+            layout = self._get_text_layout(paragraph)
+            tops = []
+            lines = []
+            iter = layout.get_iter()
+            while True:
+                top, bottom = iter.get_line_yrange()
+                tops.append(top)
+                lines.append(iter.get_line_readonly())
+                if not iter.next_line():
+                    break
+            boxes = (layout, tops, bottom, lines)
+            self.line_boxes.put(key, boxes)
+        return boxes
+
+    def _get_layout_key(self, paragraph, preedit_offset):
+        return (paragraph.get_plain_text(), self.width, self.font_key,
+                preedit_offset, self.preedit_serial if 0 <= preedit_offset else 0,
+                self.highlight_sentences)
+
+    def _get_layout(self, line):
+        # Returns the layout of the paragraph at line with the preedit text
+        # and the sentence highlights. Layouts are cached by the plain text,
+        # the width, the font and the preedit state. The selection is drawn
+        # over the layout by _draw_selection(). The layout of a giant
+        # paragraph is a ChunkedLayout.
+        paragraph = self.get_paragraph(line)
+        preedit_offset = self._get_preedit_offset(line)
+        if paragraph.chunks is not None:
+            return self._get_chunked_layout(paragraph, preedit_offset)
+        if preedit_offset < 0:
+            return self._get_text_layout(paragraph)
+        key = self._get_layout_key(paragraph, preedit_offset)
+        layout = self.preedit_layouts.get(key)
+        if layout is None:
+            layout = self._create_preedit_layout(paragraph, preedit_offset, self._get_text_layout(paragraph))
+            self.preedit_layouts.put(key, layout)
+        return layout
+
+    def _get_text_layout(self, paragraph):
+        # Returns the layout of paragraph without the preedit text.
+        key = self._get_layout_key(paragraph, -1)
+        layout = self.layouts.get(key)
+        if layout is None:
+            layout = self._create_text_layout(paragraph, -1)
+            self.layouts.put(key, layout)
+        return layout
+
+    def _get_chunked_layout(self, paragraph, preedit_offset):
+        # Returns the layout of a giant paragraph assembled from the layouts
+        # of its chunks. The layouts are kept by chunk and by paragraph
+        # rather than cached by the text, so that an edit lays out again
+        # only the chunks it replaces and the following chunks whose first
+        # lines move.
+        key = self._get_layout_key(paragraph, preedit_offset)
+        entry = self.chunk_layouts.get(paragraph)
+        if entry is not None and entry[0] == key and entry[1].chunks == paragraph.chunks:
+            return entry[1]
+        layouts = []
+        indices = []
+        shift = 0
+        for k, chunk in enumerate(paragraph.chunks):
+            indices.append(paragraph.chunk_index_starts[k] + shift)
+            # Continue the last line of the previous chunk.
+            indent = get_line_end(layouts[-1]) if layouts else 0
+            if self.width * Pango.SCALE <= indent:
+                indent = 0
+            chunk_key = self._get_layout_key(chunk, -1) + (indent,)
+            entry = self.chunk_layouts.get(chunk)
+            if entry is None or entry[0] != chunk_key:
+                layout = self._create_text_layout(chunk, -1)
+                self._set_indent(layout, indent)
+                entry = (chunk_key, layout)
+                self.chunk_layouts[chunk] = entry
+            layout = entry[1]
+            offset = self._get_chunk_preedit_offset(paragraph, k, preedit_offset)
+            if 0 <= offset:
+                chunk_key = self._get_layout_key(chunk, offset) + (indent,)
+                preedit_layout = self.preedit_layouts.get(chunk_key)
+                if preedit_layout is None:
+                    preedit_layout = self._create_preedit_layout(chunk, offset, layout)
+                    self.preedit_layouts.put(chunk_key, preedit_layout)
+                layout = preedit_layout
+                shift = len(self.preedit[0].encode())
+            layouts.append(layout)
+        layout = ChunkedLayout(list(paragraph.chunks), layouts, indices, self.spacing * Pango.SCALE)
+        self.chunk_layouts[paragraph] = (key, layout)
+        return layout
+
+    def _create_text_layout(self, paragraph, preedit_offset):
+        layout = self._create_layout()
+        text = paragraph.get_plain_text()
+        if self.highlight_sentences:
+            attr_list = self._get_sentence_attributes(paragraph)
+        else:
+            attr_list = Pango.AttrList().new()
+        if 0 <= preedit_offset:
+            text = text[:preedit_offset] + self.preedit[0] + text[preedit_offset:]
+            attr_list.splice(self.preedit[1], paragraph._get_plain_index(preedit_offset),
+                             len(self.preedit[0].encode()))
+        layout.set_text(text, -1)
+        layout.set_attributes(attr_list)
+        return layout
+
+    def _set_indent(self, layout, indent):
+        # Indents the first line of layout by indent, or does not indent it
+        # if the first line does not fit in the width then.
+        if indent:
+            layout.set_indent(indent)
+            ink, logical = layout.get_line_readonly(0).get_extents()
+            if self.width * Pango.SCALE < indent + logical.x + logical.width:
+                layout.set_indent(0)
+
+    def _create_preedit_layout(self, paragraph, preedit_offset, layout):
+        # Returns the layout of paragraph with the preedit text inserted at
+        # preedit_offset. layout is the layout of the committed text. While
+        # the line with the preedit text fits in the width, only that line
+        # is laid out again, and the returned PreeditLayout keeps the height
+        # of layout. Otherwise, the whole paragraph is laid out again.
+        # Pango.AttrList.update() needs Pango 1.44.
+        if Pango.version_check(1, 44, 0) is not None:
+            return self._create_rewrapped_layout(paragraph, preedit_offset, layout)
+        index = paragraph._get_plain_index(preedit_offset)
+        iter = layout.get_iter()
+        line = iter.get_line_readonly()
+        n = 0
+        while line.start_index + line.length <= index and iter.next_line():
+            line = iter.get_line_readonly()
+            n += 1
+        # The preedit text at the beginning of a wrapped line could move to
+        # the line above.
+        if 0 < n and line.start_index == index:
+            return self._create_rewrapped_layout(paragraph, preedit_offset, layout)
+        start = line.start_index
+        end = start + line.length
+        top, bottom = iter.get_line_yrange()
+        ink, logical = iter.get_line_extents()
+        text = paragraph.get_plain_text()
+        line_start = paragraph._get_plain_offset_from_index(start)
+        line_end = paragraph._get_plain_offset_from_index(end)
+        text = text[line_start:preedit_offset] + self.preedit[0] + text[preedit_offset:line_end]
+        attr_list = layout.get_attributes().copy()
+        attr_list.update(0, start, 0)
+        attr_list.splice(self.preedit[1], index - start, len(self.preedit[0].encode()))
+        line_layout = self._create_layout()
+        if n == 0:
+            line_layout.set_indent(layout.get_indent())
+        line_layout.set_text(text, -1)
+        line_layout.set_attributes(attr_list)
+        if 1 < line_layout.get_line_count() or line_layout.get_size()[1] != logical.height:
+            return self._create_rewrapped_layout(paragraph, preedit_offset, layout)
+        return PreeditLayout(layout, line_layout, n, start, end, top, bottom, logical.y,
+                             len(self.preedit[0].encode()))
+
+    def _create_rewrapped_layout(self, paragraph, preedit_offset, layout):
+        # Lays out paragraph with the preedit text again as a whole.
+        preedit_layout = self._create_text_layout(paragraph, preedit_offset)
+        self._set_indent(preedit_layout, layout.get_indent())
+        return preedit_layout
+
+    def _get_chunk_preedit_offset(self, paragraph, k, preedit_offset):
+        # Returns the plain offset of the preedit text in the chunk k of
+        # the giant paragraph, or -1 if the chunk has no preedit text.
+        if 0 <= preedit_offset and k == paragraph._find_chunk(paragraph.chunk_plain_starts, preedit_offset):
+            return preedit_offset - paragraph.chunk_plain_starts[k]
+        return -1
+
+    def _get_rubies(self, line):
+        # Returns the ruby runs of the paragraph at line as a list of
+        # (x, y, layout) where y is relative to the top of the paragraph. A
+        # ruby whose base text wraps is split into two runs. Runs are placed
+        # by _place_rubies() and cached by the annotated text, the width, the
+        # font and the preedit state.
+        paragraph = self.get_paragraph(line)
+        preedit_offset = self._get_preedit_offset(line)
+        key = (paragraph.get_text(), self.width, self.font_key,
+               preedit_offset, self.preedit_serial if 0 <= preedit_offset else 0)
+        rubies = self.rubies if preedit_offset < 0 else self.preedit_rubies
+        runs = rubies.get(key)
+        if runs is None:
+            runs = self._create_rubies(paragraph, self._get_layout(line), preedit_offset)
+            rubies.put(key, runs)
+        return runs
+
+    def _get_chunk_rubies(self, chunk, layout, preedit_offset):
+        # Returns the ruby runs of a chunk of a giant paragraph, which are
+        # kept by chunk as its layout.
+        if 0 <= preedit_offset:
+            key = (chunk.get_text(), self.width, self.font_key, preedit_offset, self.preedit_serial,
+                   layout.get_indent())
+            runs = self.preedit_rubies.get(key)
+            if runs is None:
+                runs = self._create_rubies(chunk, layout, preedit_offset)
+                self.preedit_rubies.put(key, runs)
+            return runs
+        key = (self.width, self.font_key, layout.get_indent())
+        entry = self.chunk_rubies.get(chunk)
+        if entry is None or entry[0] != key:
+            entry = (key, self._create_rubies(chunk, layout, -1))
+            self.chunk_rubies[chunk] = entry
+        return entry[1]
+
+    def _create_rubies(self, paragraph, layout, preedit_offset):
+        runs = []
         for pos, length, ruby in paragraph.rubies:
-            if current_line and self._has_preedit() and cursor_offset - self.preedit[2] <= pos:
+            if 0 <= preedit_offset <= pos:
                 pos += len(self.preedit[0])
-            text = plain[:pos]
-            left = layout.index_to_pos(len(text.encode()))
-            text = plain[:pos + length - 1]
-            right = layout.index_to_pos(len(text.encode()))
-            left.x /= Pango.SCALE
-            left.y /= Pango.SCALE
-            right.x += right.width
-            right.x /= Pango.SCALE
-            right.y /= Pango.SCALE
-            if left.y == right.y:
-                cr.save()
-                lt.set_text(ruby, -1)
-                PangoCairo.update_layout(cr, lt)
+            left = layout.index_to_pos(self._get_layout_index(paragraph, pos, preedit_offset))
+            right = layout.index_to_pos(self._get_layout_index(paragraph, max(0, pos + length - 1), preedit_offset))
+            left_x = left.x / Pango.SCALE
+            left_y = left.y / Pango.SCALE
+            right_x = (right.x + right.width) / Pango.SCALE
+            right_y = right.y / Pango.SCALE
+            if left_y == right_y:
+                lt = self._create_ruby_layout(ruby)
                 w, h = lt.get_pixel_size()
-                x = (left.x + right.x - w) / 2
-                if x < 0:
-                    x = 0
-                elif self.width < x + w:
-                    x = self.width - w
-                y = height + left.y - h
-                cr.move_to(x, y)
-                PangoCairo.show_layout(cr, lt)
-                cr.restore()
+                runs.append([(left_x + right_x - w) / 2, left_y, w, h, lt])
             else:
-                ruby_width = right.x + self.width - left.x
-                left_length = round(len(ruby) * (self.width - left.x) / ruby_width)
+                ruby_width = right_x + self.width - left_x
+                left_length = round(len(ruby) * (self.width - left_x) / ruby_width)
                 if 0 < left_length:
-                    text = ruby[:left_length]
-                    cr.save()
-                    lt.set_text(text, -1)
-                    PangoCairo.update_layout(cr, lt)
+                    lt = self._create_ruby_layout(ruby[:left_length])
                     w, h = lt.get_pixel_size()
-                    x = self.width - w
-                    y = height + left.y - h
-                    cr.move_to(x, y)
-                    PangoCairo.show_layout(cr, lt)
-                    cr.restore()
+                    runs.append([self.width - w, left_y, w, h, lt])
                 if left_length < len(ruby):
-                    text = ruby[left_length:]
-                    cr.save()
-                    lt.set_text(text, -1)
-                    PangoCairo.update_layout(cr, lt)
+                    lt = self._create_ruby_layout(ruby[left_length:])
                     w, h = lt.get_pixel_size()
-                    x = 0
-                    y = height + right.y - h
-                    cr.move_to(x, y)
-                    PangoCairo.show_layout(cr, lt)
-                    cr.restore()
+                    runs.append([0, right_y, w, h, lt])
+        return self._place_rubies(runs)
+
+    def _place_rubies(self, runs):
+        # Moves the ruby runs of each line, i.e., [x, y, width, height,
+        # layout], as little as possible so that they do not overlap each
+        # other or cross the edges of the line. Runs that cannot fit in a
+        # line are packed from the left edge. Returns the runs as a list of
+        # (x, y, layout).
+        lines = {}
+        for run in runs:
+            lines.setdefault(run[1], []).append(run)
+        for line in lines.values():
+            line.sort(key=lambda run: run[0])
+            right = self.width
+            for run in reversed(line):
+                run[0] = min(run[0], right - run[2])
+                right = run[0]
+            left = 0
+            for run in line:
+                run[0] = max(run[0], left)
+                left = run[0] + run[2]
+        return [(x, y - h, lt) for x, y, w, h, lt in runs]
+
+    def _create_ruby_layout(self, ruby):
+        layout = Pango.Layout(self.get_pango_context())
+        layout.set_font_description(self.ruby_font_desc)
+        layout.set_text(ruby, -1)
+        return layout
+
+    def _get_surface(self, line):
+        # Returns an image surface of the paragraph at line and its rubies
+        # without the caret, or None if the paragraph is taller than the
+        # widget, not measured yet, being composed, or at the cursor, where
+        # each keystroke would leave another revision in the cache. Surfaces
+        # are cached by the same keys as the layouts with the annotated text,
+        # the height and the scale factor.
+        h = self.heights[line]
+        if (self.get_allocated_height() < h or self.estimated[line] or
+                line == self.buffer.get_cursor().get_line() or 0 <= self._get_preedit_offset(line)):
+            return None
+        paragraph = self.get_paragraph(line)
+        scale = self.get_scale_factor()
+        key = (paragraph.get_text(),) + self._get_layout_key(paragraph, -1)[1:] + (h, scale)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = cairo.ImageSurface(cairo.FORMAT_RGB24, self.width * scale, h * scale)
+            surface.set_device_scale(scale, scale)
+            cr = cairo.Context(surface)
+            cr.set_source_rgb(1, 1, 1)
+            cr.paint()
+            cr.set_source_rgb(0, 0, 0)
+            self._draw_paragraph(cr, line, self.spacing)
+            self.surfaces.put(key, surface)
+        return surface
+
+    def _estimate(self):
+        # Estimates the heights of all the paragraphs from their lengths,
+        # and measures the paragraphs in the viewport. The other paragraphs
+        # are measured while idle. The heights measured before at the same
+        # width and font are reused.
+        offset = self._get_offset()
+        anchor = self.heights.get_line(offset)
+        anchor_y = offset - self.heights.get_y(anchor)
+        paragraphs = self.get_buffer().paragraphs
+        self._save_heights()
+        self.heights_key = (self.width, self.font_key)
+        saved = self.saved_heights.get(self.heights_key)
+        heights = self._estimate_heights(paragraphs)
+        self.estimated = bytearray(b'\x01') * len(heights)
+        if saved:
+            for line, paragraph in enumerate(paragraphs):
+                h = saved.get(paragraph.revision)
+                if h is not None:
+                    heights[line] = h
+                    self.estimated[line] = 0
+        self.heights[:] = heights
+        self.height = self.spacing + self.heights.get_total()
+        if self._vadjustment and anchor < len(heights):
+            # Keep the line at the top of the viewport.
+            self._set_upper()
+            self._vadjustment.set_value(self.heights.get_y(anchor) + min(anchor_y, heights[anchor]))
+        self._measure_viewport()
+        self.reflow_next = 0
+        if not self.reflow_source:
+            self.reflow_source = GLib.idle_add(self.on_reflow_idle)
+
+    def _save_heights(self):
+        paragraphs = self.get_buffer().paragraphs
+        if self.heights_key is None or len(self.heights) != len(paragraphs):
+            return
+        # The height of the paragraph being composed includes the preedit text.
+        cursor = self.buffer.get_cursor().get_line() if self._has_preedit() else -1
+        saved = {}
+        for line, (paragraph, h, estimated) in enumerate(zip(paragraphs, self.heights, self.estimated)):
+            if not estimated and line != cursor:
+                saved[paragraph.revision] = h
+        self.saved_heights.put(self.heights_key, saved)
+
+    def _estimate_heights(self, paragraphs):
+        columns = max(1, self.width // self.char_width)
+        heights = []
+        for paragraph in paragraphs:
+            lines = max(1, math.ceil(len(paragraph.get_plain_text()) / columns))
+            heights.append(lines * self.line_height)
+        return heights
+
+    def _measure(self, line, layout=None):
+        # Measures the paragraph at line and returns the change of its
+        # height. A scratch layout can be given so that the layout is not
+        # cached. Giant paragraphs are measured with the layouts of their
+        # chunks, which are kept anyway.
+        paragraph = self.get_paragraph(line)
+        if layout is not None and paragraph.chunks is None:
+            text = paragraph.get_plain_text()
+            preedit_offset = self._get_preedit_offset(line)
+            if 0 <= preedit_offset:
+                text = text[:preedit_offset] + self.preedit[0] + text[preedit_offset:]
+            layout.set_text(text, -1)
+        else:
+            layout = self._get_layout(line)
+        w, h = layout.get_pixel_size()
+        h += self.spacing
+        delta = h - self.heights[line]
+        self.heights[line] = h
+        self.height += delta
+        self.estimated[line] = 0
+        return delta
+
+    def _measure_viewport(self):
+        # Measures the estimated paragraphs in the viewport from the top,
+        # so that the lines above them do not move. The range is the same
+        # as on_draw() paints. Returns the first line measured, or -1 if none.
+        first = -1
+        if 0 <= self.estimated.find(1):
+            offset = round(self._get_offset())
+            bottom = offset + self.get_allocated_height()
+            line = self.heights.get_line(offset - self.spacing)
+            while line < len(self.heights) and self.heights.get_y(line) < bottom:
+                if self.estimated[line]:
+                    self._measure(line)
+                    if first < 0:
+                        first = line
+                line += 1
+            self._set_upper()
+        return first
 
     def _get_offset(self):
         return self._vadjustment.get_value() if self._vadjustment else 0
 
+    def _get_layout_index(self, paragraph, offset, preedit_offset):
+        # Returns the UTF-8 index of offset in the layout text of paragraph
+        # where the preedit text is inserted at preedit_offset.
+        if preedit_offset < 0 or offset <= preedit_offset:
+            return paragraph._get_plain_index(offset)
+        preedit = self.preedit[0]
+        if preedit_offset + len(preedit) <= offset:
+            return paragraph._get_plain_index(offset - len(preedit)) + len(preedit.encode())
+        return paragraph._get_plain_index(preedit_offset) + len(preedit[:offset - preedit_offset].encode())
+
+    def _get_layout_offset(self, paragraph, index, preedit_offset):
+        # Returns the offset of the UTF-8 index in the layout text of
+        # paragraph where the preedit text is inserted at preedit_offset.
+        if preedit_offset < 0:
+            return paragraph._get_plain_offset_from_index(index)
+        start = paragraph._get_plain_index(preedit_offset)
+        if index <= start:
+            return paragraph._get_plain_offset_from_index(index)
+        preedit = self.preedit[0].encode()
+        if start + len(preedit) <= index:
+            return paragraph._get_plain_offset_from_index(index - len(preedit)) + len(self.preedit[0])
+        return preedit_offset + len(preedit[:index - start].decode())
+
+    def _get_preedit_offset(self, line):
+        # Returns the plain offset of the preedit text in the paragraph at
+        # line, or -1 if the paragraph has no preedit text.
+        cursor = self.buffer.get_cursor()
+        if line == cursor.get_line() and self._has_preedit():
+            return cursor.get_plain_line_offset()
+        return -1
+
+    def _get_sentence_attributes(self, paragraph):
+        # Returns a copy of the attribute list that highlights the sentences
+        # in paragraph that are not short. Attribute lists are cached by the
+        # plain text.
+        attr_list = self.sentences.get(paragraph.get_plain_text())
+        if attr_list is None:
+            attr_list = Pango.AttrList().new()
+            for m in SENTENCE.finditer(paragraph.get_plain_text()):
+                start, end = m.span(1)
+                if SENTENCE_SHORT < end - start:
+                    if SENTENCE_LONG < end - start:
+                        attr = Pango.attr_background_new(0xffff, 0xa000, 0xa000)
+                    else:
+                        attr = Pango.attr_background_new(0xffff, 0xffff, 0xa000)
+                    attr.start_index = paragraph._get_plain_index(start)
+                    attr.end_index = paragraph._get_plain_index(end)
+                    attr_list.insert(attr)
+            self.sentences.put(paragraph.get_plain_text(), attr_list)
+        return attr_list.copy()
+
+    def _get_selection_indices(self, line, paragraph, preedit_offset):
+        # Returns the UTF-8 indices of the selected text in the layout of
+        # the paragraph at line, or None if no text is selected.
+        start, end = self.buffer.get_selection_bounds()
+        if start == end or line < start.get_line() or end.get_line() < line:
+            return None
+        length = len(paragraph.get_plain_text())
+        if 0 <= preedit_offset:
+            length += len(self.preedit[0])
+        if start.get_line() < line < end.get_line():
+            return 0, self._get_layout_index(paragraph, length, preedit_offset)
+        if start.get_line() == end.get_line():
+            so = start.get_plain_line_offset()
+            eo = end.get_plain_line_offset()
+            return (self._get_layout_index(paragraph, so, preedit_offset),
+                    self._get_layout_index(paragraph, eo, preedit_offset))
+        if start.get_line() == line:
+            o = start.get_plain_line_offset()
+            return (self._get_layout_index(paragraph, o, preedit_offset),
+                    self._get_layout_index(paragraph, length, preedit_offset))
+        o = end.get_plain_line_offset()
+        return 0, self._get_layout_index(paragraph, o, preedit_offset)
+
+    def _is_rewrapped(self, line):
+        # Returns True if the paragraph at line needs to be measured again
+        # with the preedit text, which is unless the line with the preedit
+        # text has been laid out over the committed text that has been
+        # measured.
+        if self.estimated[line]:
+            return True
+        layout = self._get_layout(line)
+        if layout.get_pixel_size()[1] + self.spacing != self.heights[line]:
+            return True
+        if isinstance(layout, ChunkedLayout):
+            paragraph = self.get_paragraph(line)
+            preedit_offset = self._get_preedit_offset(line)
+            if preedit_offset < 0:
+                return True
+            layout = layout.layouts[paragraph._find_chunk(paragraph.chunk_plain_starts, preedit_offset)]
+        return not isinstance(layout, PreeditLayout)
+
     def _has_preedit(self):
         return self.preedit[0]
 
@@ -206,6 +766,7 @@ class FuriganaView(Gtk.DrawingArea, Gtk.Scrollable):
         self.im.connect('preedit-end', self.on_preedit_end)
         self.im.connect('preedit-start', self.on_preedit_start)
         self.preedit = ('', None, 0)
+        self.preedit_serial = next(_preedit_serials)
 
         self.last_preedit = ''
 
@@ -361,36 +922,29 @@ class FuriganaView(Gtk.DrawingArea, Gtk.Scrollable):
         return self._hadjustment
 
     def get_iter_at_location(self, x, y):
-        cursor = self.buffer.get_cursor()
-        height = 0
-        i = 0
-        for h in self.heights:
-            if y < h + height:
-                context = self.create_pango_context()
-                layout = Pango.Layout(context)
-                desc = self.get_font()
-                layout.set_font_description(desc)
-                layout.set_width(self.width * Pango.SCALE)
-                layout.set_spacing(self.spacing * Pango.SCALE)
-                paragraph = self.get_paragraph(i)
-                text = paragraph.get_plain_text()
-                cursor_offset = len(text)
-                if i == cursor.get_line() and self._has_preedit():
-                    cursor_offset = cursor.get_plain_line_offset()
-                    text = text[:cursor_offset] + self.preedit[0] + text[cursor_offset:]
-                layout.set_text(text, -1)
-                inside, index, trailing = layout.xy_to_index(x * Pango.SCALE, (y - height) * Pango.SCALE)
-                offset = len(text.encode()[:index].decode())
-                if cursor_offset <= offset:
-                    offset -= len(self.preedit[0])
-                offset = paragraph._expand_plain_offset(offset)
-                if trailing:
-                    offset = paragraph._forward_cursor_position(offset)
-                iter = self.buffer.get_iter_at_line_offset(i, offset)
-                return inside, iter
-            height += h
-            i += 1
-        return False, self.buffer.get_end_iter()
+        i = self.heights.get_line(y)
+        if len(self.heights) <= i:
+            return False, self.buffer.get_end_iter()
+        y = (y - self.heights.get_y(i)) * Pango.SCALE
+        paragraph = self.get_paragraph(i)
+        preedit_offset = self._get_preedit_offset(i)
+        cursor_offset = len(paragraph.get_plain_text())
+        if 0 <= preedit_offset:
+            cursor_offset = preedit_offset
+        if paragraph.chunks is None and preedit_offset < 0:
+            layout, tops, bottom, lines = self._get_line_boxes(i)
+            inside, index, trailing = lines[max(0, bisect_right(tops, y) - 1)].x_to_index(x * Pango.SCALE)
+            inside = inside and tops[0] <= y < bottom
+        else:
+            inside, index, trailing = self._get_layout(i).xy_to_index(x * Pango.SCALE, y)
+        offset = self._get_layout_offset(paragraph, index, preedit_offset)
+        if cursor_offset <= offset:
+            offset -= len(self.preedit[0])
+        offset = paragraph._expand_plain_offset(offset)
+        if trailing:
+            offset = paragraph._forward_cursor_position(offset)
+        iter = self.buffer.get_iter_at_line_offset(i, offset)
+        return inside, iter
 
     def get_paragraph(self, line):
         if 0 <= line < self.get_buffer().get_line_count():
@@ -459,15 +1013,27 @@ class FuriganaView(Gtk.DrawingArea, Gtk.Scrollable):
     def on_configure(self, wid, event):
         if self._vadjustment:
             self._vadjustment.set_page_size(self.get_allocated_height())
-            self.reflow()
-            self.place_cursor_onscreen()
+            width = max(1, self.get_allocated_width() - self.padding.left - self.padding.right)
+            if width == self.width:
+                self._measure_viewport()
+                self._set_upper()
+                self.place_cursor_onscreen()
+            elif self.width == 1:
+                self.reflow()
+                self.place_cursor_onscreen()
+            else:
+                # Reflow after the window size settles, showing the current
+                # layouts in the meantime.
+                if self.resize_source:
+                    GLib.source_remove(self.resize_source)
+                self.resize_source = GLib.timeout_add(RESIZE_DELAY, self.on_resize_timeout)
+                self._set_upper()
+                self.queue_draw()
         return True
 
-    def on_delete(self, textbuffer, start, end):
-        if start.get_line() == end.get_line():
-            self.reflow_line = start.get_line()
-        else:
-            self.reflow_line = -1
+    def on_context_changed(self, *args):
+        if self.resources.get_font_key(self, self.font_desc) != self.font_key:
+            self.set_font(self.font_desc)
 
     def on_delete_surrounding(self, im, offset, n_chars):
         self.buffer.begin_user_action()
@@ -501,118 +1067,55 @@ class FuriganaView(Gtk.DrawingArea, Gtk.Scrollable):
         self.place_cursor_onscreen()
         return True
 
-    def on_deleted(self, textbuffer, start, end):
-        self.reflow(self.reflow_line)
-
-    def _check_sentences(self, text, attr_list):
-        if not self.highlight_sentences:
-            return text
-        markup = ''
-        sentence = ''
-        start = end = 0
-        text_length = len(text)
-        for i in range(text_length):
-            c = text[i]
-            if start == end:
-                if c in '\t 　':
-                    markup += c
-                    start += 1
-                    end = start
-                    continue
-            end = i + 1
-            if c in '　 。．？！' or text_length <= end:
-                if c in '　 ':
-                    end -= 1
-                else:
-                    sentence += c
-                count = end - start
-                if SENTENCE_SHORT < count:
-                    if SENTENCE_LONG < count:
-                        attr = Pango.attr_background_new(0xffff, 0xa000, 0xa000)
-                    else:
-                        attr = Pango.attr_background_new(0xffff, 0xffff, 0xa000)
-                    attr.start_index = len(markup.encode())
-                    attr.end_index = attr.start_index + len(sentence.encode())
-                    attr_list.insert(attr)
-                markup += sentence
-                if c in '　 ':
-                    markup += c
-                start = end = i + 1
-                sentence = ''
-            else:
-                sentence += c
-        return markup
-
     def on_draw(self, wid, cr):
+        left, top, right, bottom = cr.clip_extents()
         cr.set_source_rgb(1, 1, 1)
         cr.paint()
         cr.move_to(0, 0)
         cr.set_source_rgb(0, 0, 0)
         cr.translate(self.padding.left, 0)
 
-        height = wid.get_allocated_height()
         cursor = self.buffer.get_cursor()
-        start, end = self.buffer.get_selection_bounds()
+        self.drawn_cursor = (cursor.get_line(), self.buffer.get_anchor().get_line(), self.buffer.get_has_selection())
 
-        layout = PangoCairo.create_layout(cr)
-        desc = self.get_font()
-        layout.set_font_description(desc)
-        layout.set_width(self.width * Pango.SCALE)
-        layout.set_spacing(self.spacing * Pango.SCALE)
+        if 0 <= self._measure_viewport() and (0 < top or bottom < wid.get_allocated_height()):
+            # The paragraphs outside the clip may have moved.
+            self.queue_draw()
 
-        lineno = 0
-        offset = self._get_offset()
-        y = self.spacing - offset
-        for paragraph in self.buffer.paragraphs:
+        # Draw only the paragraphs in the clip. Round the offset so that
+        # the surfaces of the paragraphs are not resampled.
+        offset = round(self._get_offset())
+        lineno = self.heights.get_line(offset + top - self.spacing)
+        y = self.spacing - offset + self.heights.get_y(lineno)
+        count = min(len(self.heights), self.buffer.get_line_count())
+        while lineno < count and y - self.spacing < bottom:
             h = self.heights[lineno]
-            if y < height and 0 <= y + h:
-                text = paragraph.get_plain_text()
-                cursor_offset = len(text)
-                attr_list = Pango.AttrList().new()
-                if lineno == cursor.get_line():
-                    cursor_offset = cursor.get_plain_line_offset()
-                    if self._has_preedit():
-                        text = text[:cursor_offset] + self.preedit[0] + text[cursor_offset:]
-                        attr_list.splice(self.preedit[1], len(text[:cursor_offset].encode()),
-                                         len(self.preedit[0].encode()))
-                        cursor_offset += self.preedit[2]
-                if start == end or lineno < start.get_line() or end.get_line() < lineno:
-                    text = self._check_sentences(text, attr_list)
-                else:
-                    attr = Pango.attr_background_new(0xac00, 0xce00, 0xf700)
-                    if start.get_line() < lineno < end.get_line():
-                        attr.start_index = 0
-                        attr.end_index = len(text.encode())
-                    elif start.get_line() == end.get_line():
-                        assert lineno == end.get_line()
-                        so = start.get_plain_line_offset()
-                        eo = end.get_plain_line_offset()
-                        attr.start_index = len(text[:so].encode())
-                        attr.end_index = attr.start_index + len(text[so:eo].encode())
-                    elif start.get_line() == lineno:
-                        o = start.get_plain_line_offset()
-                        attr.start_index = len(text[:o].encode())
-                        attr.end_index = attr.start_index + len(text[o:].encode())
-                    else:
-                        assert lineno == end.get_line()
-                        o = end.get_plain_line_offset()
-                        attr.start_index = 0
-                        attr.end_index = len(text[:o].encode())
-                    attr_list.insert(attr)
-                layout.set_text(text, -1)
-                layout.set_attributes(attr_list)
-                PangoCairo.update_layout(cr, layout)
-                cr.move_to(0, y)
-                PangoCairo.show_layout(cr, layout)
-                if lineno == cursor.get_line():
-                    self._draw_rubies(cr, layout, paragraph, text, y, cursor_offset, True)
-                    self._draw_caret(cr, layout, text, y, cursor_offset)
-                else:
-                    self._draw_rubies(cr, layout, paragraph, text, y, cursor_offset, False)
+            surface = self._get_surface(lineno)
+            if surface is None:
+                self._draw_paragraph(cr, lineno, y)
+            else:
+                cr.save()
+                cr.set_source_surface(surface, 0, y - self.spacing)
+                cr.rectangle(0, y - self.spacing, self.width, h)
+                cr.fill()
+                cr.restore()
+            paragraph = self.get_paragraph(lineno)
+            preedit_offset = self._get_preedit_offset(lineno)
+            selection = self._get_selection_indices(lineno, paragraph, preedit_offset)
+            if selection is not None:
+                self._draw_selection(cr, self._get_layout(lineno), selection, y)
+            if lineno == cursor.get_line():
+                layout = self._get_layout(lineno)
+                cursor_offset = cursor.get_plain_line_offset()
+                if 0 <= preedit_offset:
+                    cursor_offset += self.preedit[2]
+                self._draw_caret(cr, layout, self._get_layout_index(paragraph, cursor_offset, preedit_offset), y)
+                self.caret.y += offset
             y += h
             lineno += 1
 
-        self.caret.y += offset
+        if not self.prerender_source:
+            self.prerender_source = GLib.idle_add(self.on_prerender_idle)
         return True
 
     def on_focus_in(self, wid, event):
@@ -626,12 +1129,6 @@ class FuriganaView(Gtk.DrawingArea, Gtk.Scrollable):
         self.im.focus_out()
         return False
 
-    def on_inserted(self, textbuffer, iter, text):
-        if has_newline(text):
-            self.reflow()
-        else:
-            self.reflow(iter.get_line())
-
     def on_key_press(self, wid, event):
         LOGGER.debug(f'on_key_press: {Gdk.keyval_name(event.keyval)}, {event.state:#08x}')
         if self.im.filter_keypress(event):
@@ -693,26 +1190,100 @@ class FuriganaView(Gtk.DrawingArea, Gtk.Scrollable):
         self.click_count = 0
         return True
 
+    def on_lines_changed(self, textbuffer, first, removed, added):
+        if len(self.heights) != len(textbuffer.paragraphs) - added + removed:
+            self.reflow()
+            return
+        if removed == 1 and added == 1:
+            self.reflow(first)
+            return
+        # Splice the estimated heights of the new paragraphs, and measure
+        # them in the viewport now and the others while idle.
+        heights = self._estimate_heights(textbuffer.paragraphs[first:first + added])
+        self.height += sum(heights) - sum(self.heights[first:first + removed])
+        self.heights[first:first + removed] = heights
+        self.estimated[first:first + removed] = b'\x01' * added
+        measured = self._measure_viewport()
+        self._set_upper()
+        self.reflow_next = first
+        if not self.reflow_source:
+            self.reflow_source = GLib.idle_add(self.on_reflow_idle)
+        self._queue_draw_lines(first if measured < 0 else min(first, measured))
+
     def on_preedit_changed(self, im):
         if self.preedit[0]:
             self.last_preedit = self.preedit[0]
 
         self.preedit = self.im.get_preedit_string()
+        self.preedit_serial = next(_preedit_serials)
         cursor = self.buffer.get_cursor()
         self.buffer.delete_selection(True, True)
-        self.reflow(cursor.get_line())
+        line = cursor.get_line()
+        if self._is_rewrapped(line):
+            self.reflow(line)
+        else:
+            self._queue_draw_lines(line, line)
         LOGGER.debug(f'on_preedit_changed: "{self.preedit[0]}" {self.preedit[2]}')
 
     def on_preedit_end(self, im):
         self.preedit = self.im.get_preedit_string()
+        self.preedit_serial = next(_preedit_serials)
         self.buffer.delete_selection(True, True)
         LOGGER.debug(f'on_preedit_end: "{self.preedit[0]}" {self.preedit[2]}')
 
     def on_preedit_start(self, im):
         self.preedit = self.im.get_preedit_string()
+        self.preedit_serial = next(_preedit_serials)
         self.buffer.delete_selection(True, True)
         LOGGER.debug(f'on_preedit_start: "{self.preedit[0]}" {self.preedit[2]}')
 
+    def on_prerender_idle(self):
+        # Renders the paragraphs within a page above and below the viewport
+        # so that they are ready to scroll in.
+        deadline = time.monotonic() + REFLOW_BUDGET
+        offset = self._get_offset()
+        height = self.get_allocated_height()
+        first = self.heights.get_line(offset - height)
+        last = min(len(self.heights), self.heights.get_line(offset + 2 * height) + 1)
+        for line in range(first, last):
+            if deadline < time.monotonic():
+                return True
+            self._get_surface(line)
+        self.prerender_source = 0
+        return False
+
+    def on_reflow_idle(self):
+        deadline = time.monotonic() + REFLOW_BUDGET
+        layout = self._create_layout()
+        offset = self._get_offset()
+        top = self.heights.get_line(offset)
+        shift = 0
+        while time.monotonic() < deadline:
+            line = self.estimated.find(1, self.reflow_next)
+            if line < 0:
+                line = self.estimated.find(1)
+                if line < 0:
+                    break
+            delta = self._measure(line, layout)
+            if line < top:
+                shift += delta
+            self.reflow_next = line + 1
+        self._set_upper()
+        if shift and self._vadjustment:
+            # Keep the viewport on the same text as the heights above it change.
+            self._vadjustment.set_value(offset + shift)
+        if 0 <= self.estimated.find(1):
+            return True
+        LOGGER.debug(f'on_reflow_idle: done: layout cache {self.layouts.hits} hits, {self.layouts.misses} misses')
+        self.reflow_source = 0
+        return False
+
+    def on_resize_timeout(self):
+        self.resize_source = 0
+        self.reflow()
+        self.place_cursor_onscreen()
+        return False
+
     def on_retrieve_surrounding(self, im):
         text, offset = self.buffer.get_surrounding()
         self.im.set_surrounding(text, len(text.encode()), len(text[:offset].encode()))
@@ -728,50 +1299,23 @@ class FuriganaView(Gtk.DrawingArea, Gtk.Scrollable):
             self.im.reset()
 
     def reflow(self, line=-1, redraw=True):
-        self.width = max(1, self.get_allocated_width() - self.padding.left - self.padding.right)
-
-        cursor = self.buffer.get_cursor()
-
-        context = self.create_pango_context()
-        layout = Pango.Layout(context)
-        desc = self.get_font()
-        layout.set_font_description(desc)
-        layout.set_width(self.width * Pango.SCALE)
-        layout.set_spacing(self.spacing * Pango.SCALE)
+        width = max(1, self.get_allocated_width() - self.padding.left - self.padding.right)
+        if width != self.width:
+            self.width = width
+            line = -1
 
         paragraph = self.get_paragraph(line)
         if paragraph and self.heights:
-            self.height -= self.heights[line]
-            text = paragraph.get_plain_text()
-            if line == cursor.get_line() and self._has_preedit():
-                cursor_offset = cursor.get_plain_line_offset()
-                text = text[:cursor_offset] + self.preedit[0] + text[cursor_offset:]
-            layout.set_text(text, -1)
-            w, h = layout.get_pixel_size()
-            h += self.spacing
-            self.heights[line] = h
-            self.height += h
+            delta = self._measure(line)
+            self._set_upper()
+            if redraw:
+                # The paragraphs below move if the height has changed.
+                self._queue_draw_lines(line, line if delta == 0 else -1)
         else:
-            self.heights.clear()
-            self.height = self.spacing
-            for paragraph in self.get_buffer().paragraphs:
-                text = paragraph.get_plain_text()
-                if line == cursor.get_line() and self._has_preedit():
-                    cursor_offset = cursor.get_plain_line_offset()
-                    text = text[:cursor_offset] + self.preedit[0] + text[cursor_offset:]
-                layout.set_text(text, -1)
-                w, h = layout.get_pixel_size()
-                h += self.spacing
-                self.heights.append(h)
-                self.height += h
-
-        if self._vadjustment:
-            allocated = self.get_allocated_height()
-            upper = allocated if self.height < allocated else self.height
-            self._vadjustment.set_upper(upper)
-
-        if redraw:
-            self.queue_draw()
+            self._estimate()
+            self._set_upper()
+            if redraw:
+                self.queue_draw()
 
     def scroll_mark_onscreen(self, mark):
         if not self._vadjustment:
@@ -780,27 +1324,21 @@ class FuriganaView(Gtk.DrawingArea, Gtk.Scrollable):
         height = self.get_allocated_height()
         offset = self._vadjustment.get_value()
 
-        y = 0
         line = mark.iter.get_line()
-        for i in range(line):
-            y += self.heights[i]
-
-        context = self.create_pango_context()
-        layout = Pango.Layout(context)
-        desc = self.get_font()
-        layout.set_font_description(desc)
-        layout.set_width(self.width * Pango.SCALE)
-        layout.set_spacing(self.spacing * Pango.SCALE)
-        text = self.buffer.paragraphs[line].get_plain_text()
-        layout.set_text(text, -1)
-
-        current = text[:mark.iter.get_plain_line_offset()]
-        pos = layout.index_to_pos(len(current.encode()))
+        if line < len(self.estimated) and self.estimated[line]:
+            self._measure(line)
+            self._set_upper()
+        y = self.heights.get_y(line)
+
+        paragraph = self.buffer.paragraphs[line]
+        layout = self._get_layout(line)
+        index = self._get_layout_index(paragraph, mark.iter.get_plain_line_offset(), self._get_preedit_offset(line))
+        pos = layout.index_to_pos(index)
         y += pos.y / Pango.SCALE
 
         upper = self._vadjustment.get_upper()
         if offset <= y and y + self.line_height <= offset + height <= upper:
-            self.queue_draw()
+            self._queue_draw_cursor()
             return
 
         if y < offset:
@@ -815,6 +1353,60 @@ class FuriganaView(Gtk.DrawingArea, Gtk.Scrollable):
         self._vadjustment.set_value(y)
         self.queue_draw()
 
+    def _queue_draw_caret(self, caret, offset):
+        self.queue_draw_area(self.padding.left + math.floor(caret.x), math.floor(caret.y - offset),
+                             math.ceil(caret.width) + 1, math.ceil(caret.height) + 1)
+
+    def _queue_draw_cursor(self):
+        # Queues redrawing the old and the new carets, and the paragraphs
+        # whose selection may have changed since they were drawn.
+        if self.drawn_cursor is None:
+            self.queue_draw()
+            return
+        offset = self._get_offset()
+        self._queue_draw_caret(self.caret, offset)
+        iter = self.buffer.get_cursor()
+        cursor = iter.get_line()
+        paragraph = self.get_paragraph(cursor)
+        preedit_offset = self._get_preedit_offset(cursor)
+        cursor_offset = iter.get_plain_line_offset()
+        if 0 <= preedit_offset:
+            cursor_offset += self.preedit[2]
+        index = self._get_layout_index(paragraph, cursor_offset, preedit_offset)
+        y = self.spacing + self.heights.get_y(cursor)
+        self._queue_draw_caret(self._get_caret(self._get_layout(cursor), index, y), offset)
+
+        anchor = self.buffer.get_anchor().get_line()
+        drawn_cursor, drawn_anchor, drawn_selected = self.drawn_cursor
+        if not drawn_selected and not self.buffer.get_has_selection():
+            return
+        if anchor == drawn_anchor:
+            self._queue_draw_lines(min(cursor, drawn_cursor), max(cursor, drawn_cursor))
+            self._queue_draw_lines(anchor, anchor)
+        else:
+            self._queue_draw_lines(min(drawn_cursor, drawn_anchor), max(drawn_cursor, drawn_anchor))
+            self._queue_draw_lines(min(cursor, anchor), max(cursor, anchor))
+
+    def _queue_draw_lines(self, first, last=-1):
+        # Queues redrawing the paragraphs from first to last, or to the
+        # bottom of the widget if last is -1. The area includes the spacing
+        # above the paragraphs where the rubies are drawn.
+        offset = self._get_offset()
+        height = self.get_allocated_height()
+        top = max(0, math.floor(self.heights.get_y(first) - offset))
+        if last < 0:
+            bottom = height
+        else:
+            bottom = min(height, math.ceil(self.heights.get_y(last + 1) + self.spacing - offset))
+        if top < bottom:
+            self.queue_draw_area(0, top, self.get_allocated_width(), bottom - top)
+
+    def _set_upper(self):
+        if self._vadjustment:
+            allocated = self.get_allocated_height()
+            upper = allocated if self.height < allocated else self.height
+            self._vadjustment.set_upper(upper)
+
     def set_check_sentences(self, value):
         if value != self.highlight_sentences:
             self.highlight_sentences = value
@@ -822,16 +1414,13 @@ class FuriganaView(Gtk.DrawingArea, Gtk.Scrollable):
 
     def set_font(self, font_desc):
         self.font_desc = font_desc
-        context = self.create_pango_context()
-        context.set_font_description(font_desc)
-        metrics = context.get_metrics(None, None)
-        if Pango.version_check(1, 44, 0) is None:
-            line_height = metrics.get_height()
-        else:
-            line_height = metrics.get_ascent() + metrics.get_descent()
-        self.line_height = math.ceil(line_height * 1.6 / Pango.SCALE)
-        self.spacing = math.ceil(line_height * 0.6 / Pango.SCALE)
+        self.font_key = self.resources.get_font_key(self, font_desc)
+        self.ruby_font_desc = font_desc.copy_static()
+        self.ruby_font_desc.set_size(font_desc.get_size() // RUBY_DIV)
+        self.line_height, self.spacing, self.char_width = self.resources.get_metrics(self, font_desc)
         LOGGER.debug(f'set_font: spacing={self.spacing}, line_height={self.line_height}')
+        self.preedit_layouts.clear()
+        self.preedit_rubies.clear()
         self.reflow()
 
     def set_hadjustment(self, adjustment):
@@ -0,0 +1,535 @@
+#
+# Copyright (c) 2025  Esrille Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+# Generated by tools/make_unicode_tables.py from Unicode 14.0.0. Do not edit.
+#
+# The character at code point c has the property values VALUES[i] where
+# STARTS[i] <= c < STARTS[i + 1]. The upper four bits are the
+# Grapheme_Cluster_Break and the lower four bits are the word class.
+
+STARTS = (
+    0, 32, 33, 48, 58, 65, 91, 97, 123, 127, 160, 161,
+    169, 170, 171, 173, 174, 175, 178, 180, 181, 182, 185, 187,
+    188, 191, 192, 215, 216, 247, 248, 706, 710, 722, 736, 741,
+    748, 749, 750, 751, 768, 880, 885, 886, 888, 890, 894, 895,
+    896, 902, 903, 904, 907, 908, 909, 910, 930, 931, 1014, 1015,
+    1154, 1155, 1162, 1328, 1329, 1367, 1369, 1370, 1376, 1417, 1425, 1470,
+    1471, 1472, 1473, 1475, 1476, 1478, 1479, 1480, 1488, 1515, 1519, 1523,
+    1536, 1542, 1552, 1563, 1564, 1565, 1568, 1611, 1632, 1642, 1646, 1648,
+    1649, 1748, 1749, 1750, 1757, 1758, 1759, 1765, 1767, 1769, 1770, 1774,
+    1789, 1791, 1792, 1807, 1808, 1809, 1810, 1840, 1867, 1869, 1958, 1969,
+    1970, 1984, 2027, 2036, 2038, 2042, 2043, 2045, 2046, 2048, 2070, 2074,
+    2075, 2084, 2085, 2088, 2089, 2094, 2112, 2137, 2140, 2144, 2155, 2160,
+    2184, 2185, 2191, 2192, 2194, 2200, 2208, 2250, 2274, 2275, 2307, 2308,
+    2362, 2363, 2364, 2365, 2366, 2369, 2377, 2381, 2382, 2384, 2385, 2392,
+    2402, 2404, 2406, 2416, 2417, 2433, 2434, 2436, 2437, 2445, 2447, 2449,
+    2451, 2473, 2474, 2481, 2482, 2483, 2486, 2490, 2492, 2493, 2494, 2497,
+    2501, 2503, 2505, 2507, 2509, 2510, 2511, 2519, 2520, 2524, 2526, 2527,
+    2530, 2532, 2534, 2546, 2548, 2554, 2556, 2557, 2558, 2559, 2561, 2563,
+    2564, 2565, 2571, 2575, 2577, 2579, 2601, 2602, 2609, 2610, 2612, 2613,
+    2615, 2616, 2618, 2620, 2621, 2622, 2625, 2627, 2631, 2633, 2635, 2638,
+    2641, 2642, 2649, 2653, 2654, 2655, 2662, 2672, 2674, 2677, 2678, 2689,
+    2691, 2692, 2693, 2702, 2703, 2706, 2707, 2729, 2730, 2737, 2738, 2740,
+    2741, 2746, 2748, 2749, 2750, 2753, 2758, 2759, 2761, 2762, 2763, 2765,
+    2766, 2768, 2769, 2784, 2786, 2788, 2790, 2800, 2809, 2810, 2816, 2817,
+    2818, 2820, 2821, 2829, 2831, 2833, 2835, 2857, 2858, 2865, 2866, 2868,
+    2869, 2874, 2876, 2877, 2878, 2879, 2880, 2881, 2885, 2887, 2889, 2891,
+    2893, 2894, 2901, 2903, 2904, 2908, 2910, 2911, 2914, 2916, 2918, 2928,
+    2929, 2936, 2946, 2947, 2948, 2949, 2955, 2958, 2961, 2962, 2966, 2969,
+    2971, 2972, 2973, 2974, 2976, 2979, 2981, 2984, 2987, 2990, 3002, 3006,
+    3008, 3009, 3011, 3014, 3017, 3018, 3021, 3022, 3024, 3025, 3031, 3032,
+    3046, 3059, 3072, 3073, 3076, 3077, 3085, 3086, 3089, 3090, 3113, 3114,
+    3130, 3132, 3133, 3134, 3137, 3141, 3142, 3145, 3146, 3150, 3157, 3159,
+    3160, 3163, 3165, 3166, 3168, 3170, 3172, 3174, 3184, 3192, 3199, 3200,
+    3201, 3202, 3204, 3205, 3213, 3214, 3217, 3218, 3241, 3242, 3252, 3253,
+    3258, 3260, 3261, 3262, 3263, 3264, 3269, 3270, 3271, 3273, 3274, 3276,
+    3278, 3285, 3287, 3293, 3295, 3296, 3298, 3300, 3302, 3312, 3313, 3315,
+    3328, 3330, 3332, 3341, 3342, 3345, 3346, 3387, 3389, 3390, 3393, 3397,
+    3398, 3401, 3402, 3405, 3406, 3407, 3412, 3415, 3416, 3426, 3428, 3430,
+    3449, 3450, 3456, 3457, 3458, 3460, 3461, 3479, 3482, 3506, 3507, 3516,
+    3517, 3518, 3520, 3527, 3530, 3531, 3535, 3538, 3541, 3542, 3543, 3544,
+    3552, 3558, 3568, 3570, 3572, 3585, 3633, 3634, 3636, 3643, 3648, 3655,
+    3663, 3664, 3674, 3713, 3715, 3716, 3717, 3718, 3723, 3724, 3748, 3749,
+    3750, 3751, 3761, 3762, 3764, 3773, 3774, 3776, 3781, 3782, 3783, 3784,
+    3790, 3792, 3802, 3804, 3808, 3840, 3841, 3864, 3866, 3872, 3892, 3893,
+    3894, 3895, 3896, 3897, 3898, 3902, 3904, 3912, 3913, 3949, 3953, 3967,
+    3968, 3973, 3974, 3976, 3981, 3992, 3993, 4029, 4038, 4039, 4096, 4139,
+    4141, 4145, 4146, 4152, 4153, 4155, 4157, 4159, 4170, 4176, 4182, 4184,
+    4186, 4190, 4193, 4194, 4197, 4199, 4206, 4209, 4213, 4226, 4227, 4229,
+    4231, 4237, 4238, 4239, 4240, 4250, 4253, 4254, 4256, 4294, 4295, 4296,
+    4301, 4302, 4304, 4347, 4348, 4352, 4448, 4520, 4608, 4681, 4682, 4686,
+    4688, 4695, 4696, 4697, 4698, 4702, 4704, 4745, 4746, 4750, 4752, 4785,
+    4786, 4790, 4792, 4799, 4800, 4801, 4802, 4806, 4808, 4823, 4824, 4881,
+    4882, 4886, 4888, 4955, 4957, 4960, 4969, 4989, 4992, 5008, 5024, 5110,
+    5112, 5118, 5121, 5741, 5743, 5760, 5761, 5787, 5792, 5867, 5870, 5881,
+    5888, 5906, 5909, 5910, 5919, 5938, 5940, 5941, 5952, 5970, 5972, 5984,
+    5997, 5998, 6001, 6002, 6004, 6016, 6068, 6070, 6071, 6078, 6086, 6087,
+    6089, 6100, 6103, 6104, 6108, 6109, 6110, 6112, 6122, 6128, 6138, 6155,
+    6158, 6159, 6160, 6170, 6176, 6265, 6272, 6277, 6279, 6313, 6314, 6315,
+    6320, 6390, 6400, 6431, 6432, 6435, 6439, 6441, 6444, 6448, 6450, 6451,
+    6457, 6460, 6470, 6510, 6512, 6517, 6528, 6572, 6576, 6602, 6608, 6619,
+    6656, 6679, 6681, 6683, 6684, 6688, 6741, 6742, 6743, 6744, 6751, 6752,
+    6753, 6754, 6755, 6757, 6765, 6771, 6781, 6783, 6784, 6794, 6800, 6810,
+    6823, 6824, 6832, 6863, 6912, 6916, 6917, 6964, 6965, 6966, 6971, 6972,
+    6973, 6978, 6979, 6981, 6989, 6992, 7002, 7019, 7028, 7040, 7042, 7043,
+    7073, 7074, 7078, 7080, 7082, 7083, 7086, 7142, 7143, 7144, 7146, 7149,
+    7150, 7151, 7154, 7156, 7168, 7204, 7212, 7220, 7222, 7224, 7232, 7242,
+    7245, 7294, 7296, 7305, 7312, 7355, 7357, 7360, 7376, 7379, 7380, 7393,
+    7394, 7401, 7405, 7406, 7412, 7413, 7415, 7416, 7418, 7419, 7424, 7616,
+    7680, 7958, 7960, 7966, 7968, 8006, 8008, 8014, 8016, 8024, 8025, 8026,
+    8027, 8028, 8029, 8030, 8031, 8062, 8064, 8117, 8118, 8125, 8126, 8127,
+    8130, 8133, 8134, 8141, 8144, 8148, 8150, 8156, 8160, 8173, 8178, 8181,
+    8182, 8189, 8192, 8203, 8204, 8205, 8206, 8208, 8232, 8234, 8239, 8240,
+    8252, 8253, 8265, 8266, 8287, 8288, 8293, 8294, 8304, 8306, 8308, 8314,
+    8319, 8330, 8336, 8349, 8400, 8433, 8450, 8451, 8455, 8456, 8458, 8468,
+    8469, 8470, 8473, 8478, 8482, 8483, 8484, 8485, 8486, 8487, 8488, 8489,
+    8490, 8494, 8495, 8505, 8506, 8508, 8512, 8517, 8522, 8526, 8527, 8528,
+    8586, 8596, 8602, 8617, 8619, 8986, 8988, 9000, 9001, 9096, 9097, 9167,
+    9168, 9193, 9204, 9208, 9211, 9312, 9372, 9410, 9411, 9450, 9472, 9642,
+    9644, 9654, 9655, 9664, 9665, 9723, 9727, 9728, 9734, 9735, 9747, 9748,
+    9862, 9872, 9990, 9992, 10003, 10004, 10005, 10006, 10007, 10013, 10014, 10017,
+    10018, 10024, 10025, 10035, 10037, 10052, 10053, 10055, 10056, 10060, 10061, 10062,
+    10063, 10067, 10070, 10071, 10072, 10083, 10088, 10102, 10132, 10133, 10136, 10145,
+    10146, 10160, 10161, 10175, 10176, 10548, 10550, 11013, 11016, 11035, 11037, 11088,
+    11089, 11093, 11094, 11264, 11493, 11499, 11503, 11506, 11508, 11517, 11518, 11520,
+    11558, 11559, 11560, 11565, 11566, 11568, 11624, 11631, 11632, 11647, 11648, 11671,
+    11680, 11687, 11688, 11695, 11696, 11703, 11704, 11711, 11712, 11719, 11720, 11727,
+    11728, 11735, 11736, 11743, 11744, 11776, 11823, 11824, 12288, 12289, 12293, 12295,
+    12296, 12321, 12330, 12334, 12336, 12337, 12342, 12344, 12349, 12350, 12353, 12439,
+    12441, 12443, 12445, 12447, 12448, 12449, 12539, 12540, 12543, 12544, 12549, 12592,
+    12593, 12687, 12690, 12694, 12704, 12736, 12784, 12800, 12832, 12842, 12872, 12880,
+    12881, 12896, 12928, 12938, 12951, 12952, 12953, 12954, 12977, 12992, 13008, 13055,
+    13056, 13144, 13312, 19904, 19968, 40960, 42125, 42192, 42238, 42240, 42509, 42512,
+    42540, 42560, 42607, 42611, 42612, 42622, 42623, 42654, 42656, 42736, 42738, 42775,
+    42784, 42786, 42889, 42891, 42955, 42960, 42962, 42963, 42964, 42965, 42970, 42994,
+    43010, 43011, 43014, 43015, 43019, 43020, 43043, 43045, 43047, 43048, 43052, 43053,
+    43056, 43062, 43072, 43124, 43136, 43138, 43188, 43204, 43206, 43216, 43226, 43232,
+    43250, 43256, 43259, 43260, 43261, 43263, 43264, 43302, 43310, 43312, 43335, 43346,
+    43348, 43360, 43389, 43392, 43395, 43396, 43443, 43444, 43446, 43450, 43452, 43454,
+    43457, 43471, 43482, 43488, 43493, 43494, 43519, 43520, 43561, 43567, 43569, 43571,
+    43573, 43575, 43584, 43587, 43588, 43596, 43597, 43598, 43600, 43610, 43616, 43639,
+    43642, 43643, 43644, 43645, 43646, 43696, 43697, 43698, 43701, 43703, 43705, 43710,
+    43712, 43713, 43714, 43715, 43739, 43742, 43744, 43755, 43756, 43758, 43760, 43762,
+    43765, 43766, 43767, 43777, 43783, 43785, 43791, 43793, 43799, 43808, 43815, 43816,
+    43823, 43824, 43867, 43868, 43882, 43888, 44003, 44005, 44006, 44008, 44009, 44011,
+    44012, 44013, 44014, 44016, 44026, 44032, 44033, 44060, 44061, 44088, 44089, 44116,
+    44117, 44144, 44145, 44172, 44173, 44200, 44201, 44228, 44229, 44256, 44257, 44284,
+    44285, 44312, 44313, 44340, 44341, 44368, 44369, 44396, 44397, 44424, 44425, 44452,
+    44453, 44480, 44481, 44508, 44509, 44536, 44537, 44564, 44565, 44592, 44593, 44620,
+    44621, 44648, 44649, 44676, 44677, 44704, 44705, 44732, 44733, 44760, 44761, 44788,
+    44789, 44816, 44817, 44844, 44845, 44872, 44873, 44900, 44901, 44928, 44929, 44956,
+    44957, 44984, 44985, 45012, 45013, 45040, 45041, 45068, 45069, 45096, 45097, 45124,
+    45125, 45152, 45153, 45180, 45181, 45208, 45209, 45236, 45237, 45264, 45265, 45292,
+    45293, 45320, 45321, 45348, 45349, 45376, 45377, 45404, 45405, 45432, 45433, 45460,
+    45461, 45488, 45489, 45516, 45517, 45544, 45545, 45572, 45573, 45600, 45601, 45628,
+    45629, 45656, 45657, 45684, 45685, 45712, 45713, 45740, 45741, 45768, 45769, 45796,
+    45797, 45824, 45825, 45852, 45853, 45880, 45881, 45908, 45909, 45936, 45937, 45964,
+    45965, 45992, 45993, 46020, 46021, 46048, 46049, 46076, 46077, 46104, 46105, 46132,
+    46133, 46160, 46161, 46188, 46189, 46216, 46217, 46244, 46245, 46272, 46273, 46300,
+    46301, 46328, 46329, 46356, 46357, 46384, 46385, 46412, 46413, 46440, 46441, 46468,
+    46469, 46496, 46497, 46524, 46525, 46552, 46553, 46580, 46581, 46608, 46609, 46636,
+    46637, 46664, 46665, 46692, 46693, 46720, 46721, 46748, 46749, 46776, 46777, 46804,
+    46805, 46832, 46833, 46860, 46861, 46888, 46889, 46916, 46917, 46944, 46945, 46972,
+    46973, 47000, 47001, 47028, 47029, 47056, 47057, 47084, 47085, 47112, 47113, 47140,
+    47141, 47168, 47169, 47196, 47197, 47224, 47225, 47252, 47253, 47280, 47281, 47308,
+    47309, 47336, 47337, 47364, 47365, 47392, 47393, 47420, 47421, 47448, 47449, 47476,
+    47477, 47504, 47505, 47532, 47533, 47560, 47561, 47588, 47589, 47616, 47617, 47644,
+    47645, 47672, 47673, 47700, 47701, 47728, 47729, 47756, 47757, 47784, 47785, 47812,
+    47813, 47840, 47841, 47868, 47869, 47896, 47897, 47924, 47925, 47952, 47953, 47980,
+    47981, 48008, 48009, 48036, 48037, 48064, 48065, 48092, 48093, 48120, 48121, 48148,
+    48149, 48176, 48177, 48204, 48205, 48232, 48233, 48260, 48261, 48288, 48289, 48316,
+    48317, 48344, 48345, 48372, 48373, 48400, 48401, 48428, 48429, 48456, 48457, 48484,
+    48485, 48512, 48513, 48540, 48541, 48568, 48569, 48596, 48597, 48624, 48625, 48652,
+    48653, 48680, 48681, 48708, 48709, 48736, 48737, 48764, 48765, 48792, 48793, 48820,
+    48821, 48848, 48849, 48876, 48877, 48904, 48905, 48932, 48933, 48960, 48961, 48988,
+    48989, 49016, 49017, 49044, 49045, 49072, 49073, 49100, 49101, 49128, 49129, 49156,
+    49157, 49184, 49185, 49212, 49213, 49240, 49241, 49268, 49269, 49296, 49297, 49324,
+    49325, 49352, 49353, 49380, 49381, 49408, 49409, 49436, 49437, 49464, 49465, 49492,
+    49493, 49520, 49521, 49548, 49549, 49576, 49577, 49604, 49605, 49632, 49633, 49660,
+    49661, 49688, 49689, 49716, 49717, 49744, 49745, 49772, 49773, 49800, 49801, 49828,
+    49829, 49856, 49857, 49884, 49885, 49912, 49913, 49940, 49941, 49968, 49969, 49996,
+    49997, 50024, 50025, 50052, 50053, 50080, 50081, 50108, 50109, 50136, 50137, 50164,
+    50165, 50192, 50193, 50220, 50221, 50248, 50249, 50276, 50277, 50304, 50305, 50332,
+    50333, 50360, 50361, 50388, 50389, 50416, 50417, 50444, 50445, 50472, 50473, 50500,
+    50501, 50528, 50529, 50556, 50557, 50584, 50585, 50612, 50613, 50640, 50641, 50668,
+    50669, 50696, 50697, 50724, 50725, 50752, 50753, 50780, 50781, 50808, 50809, 50836,
+    50837, 50864, 50865, 50892, 50893, 50920, 50921, 50948, 50949, 50976, 50977, 51004,
+    51005, 51032, 51033, 51060, 51061, 51088, 51089, 51116, 51117, 51144, 51145, 51172,
+    51173, 51200, 51201, 51228, 51229, 51256, 51257, 51284, 51285, 51312, 51313, 51340,
+    51341, 51368, 51369, 51396, 51397, 51424, 51425, 51452, 51453, 51480, 51481, 51508,
+    51509, 51536, 51537, 51564, 51565, 51592, 51593, 51620, 51621, 51648, 51649, 51676,
+    51677, 51704, 51705, 51732, 51733, 51760, 51761, 51788, 51789, 51816, 51817, 51844,
+    51845, 51872, 51873, 51900, 51901, 51928, 51929, 51956, 51957, 51984, 51985, 52012,
+    52013, 52040, 52041, 52068, 52069, 52096, 52097, 52124, 52125, 52152, 52153, 52180,
+    52181, 52208, 52209, 52236, 52237, 52264, 52265, 52292, 52293, 52320, 52321, 52348,
+    52349, 52376, 52377, 52404, 52405, 52432, 52433, 52460, 52461, 52488, 52489, 52516,
+    52517, 52544, 52545, 52572, 52573, 52600, 52601, 52628, 52629, 52656, 52657, 52684,
+    52685, 52712, 52713, 52740, 52741, 52768, 52769, 52796, 52797, 52824, 52825, 52852,
+    52853, 52880, 52881, 52908, 52909, 52936, 52937, 52964, 52965, 52992, 52993, 53020,
+    53021, 53048, 53049, 53076, 53077, 53104, 53105, 53132, 53133, 53160, 53161, 53188,
+    53189, 53216, 53217, 53244, 53245, 53272, 53273, 53300, 53301, 53328, 53329, 53356,
+    53357, 53384, 53385, 53412, 53413, 53440, 53441, 53468, 53469, 53496, 53497, 53524,
+    53525, 53552, 53553, 53580, 53581, 53608, 53609, 53636, 53637, 53664, 53665, 53692,
+    53693, 53720, 53721, 53748, 53749, 53776, 53777, 53804, 53805, 53832, 53833, 53860,
+    53861, 53888, 53889, 53916, 53917, 53944, 53945, 53972, 53973, 54000, 54001, 54028,
+    54029, 54056, 54057, 54084, 54085, 54112, 54113, 54140, 54141, 54168, 54169, 54196,
+    54197, 54224, 54225, 54252, 54253, 54280, 54281, 54308, 54309, 54336, 54337, 54364,
+    54365, 54392, 54393, 54420, 54421, 54448, 54449, 54476, 54477, 54504, 54505, 54532,
+    54533, 54560, 54561, 54588, 54589, 54616, 54617, 54644, 54645, 54672, 54673, 54700,
+    54701, 54728, 54729, 54756, 54757, 54784, 54785, 54812, 54813, 54840, 54841, 54868,
+    54869, 54896, 54897, 54924, 54925, 54952, 54953, 54980, 54981, 55008, 55009, 55036,
+    55037, 55064, 55065, 55092, 55093, 55120, 55121, 55148, 55149, 55176, 55177, 55204,
+    55216, 55239, 55243, 55292, 55296, 57344, 63744, 64110, 64112, 64218, 64256, 64263,
+    64275, 64280, 64285, 64286, 64287, 64297, 64298, 64311, 64312, 64317, 64318, 64319,
+    64320, 64322, 64323, 64325, 64326, 64434, 64467, 64830, 64848, 64912, 64914, 64968,
+    65008, 65020, 65024, 65040, 65056, 65072, 65136, 65141, 65142, 65277, 65279, 65280,
+    65296, 65306, 65313, 65339, 65345, 65371, 65382, 65392, 65393, 65438, 65440, 65471,
+    65474, 65480, 65482, 65488, 65490, 65496, 65498, 65501, 65529, 65532, 65536, 65548,
+    65549, 65575, 65576, 65595, 65596, 65598, 65599, 65614, 65616, 65630, 65664, 65787,
+    65799, 65844, 65856, 65913, 65930, 65932, 66045, 66046, 66176, 66205, 66208, 66257,
+    66272, 66273, 66300, 66304, 66340, 66349, 66379, 66384, 66422, 66427, 66432, 66462,
+    66464, 66500, 66504, 66512, 66513, 66518, 66560, 66718, 66720, 66730, 66736, 66772,
+    66776, 66812, 66816, 66856, 66864, 66916, 66928, 66939, 66940, 66955, 66956, 66963,
+    66964, 66966, 66967, 66978, 66979, 66994, 66995, 67002, 67003, 67005, 67072, 67383,
+    67392, 67414, 67424, 67432, 67456, 67462, 67463, 67505, 67506, 67515, 67584, 67590,
+    67592, 67593, 67594, 67638, 67639, 67641, 67644, 67645, 67647, 67670, 67672, 67703,
+    67705, 67743, 67751, 67760, 67808, 67827, 67828, 67830, 67835, 67868, 67872, 67898,
+    67968, 68024, 68028, 68048, 68050, 68097, 68100, 68101, 68103, 68108, 68112, 68116,
+    68117, 68120, 68121, 68150, 68152, 68155, 68159, 68160, 68169, 68192, 68223, 68224,
+    68256, 68288, 68296, 68297, 68325, 68327, 68331, 68336, 68352, 68406, 68416, 68438,
+    68440, 68467, 68472, 68498, 68521, 68528, 68608, 68681, 68736, 68787, 68800, 68851,
+    68858, 68900, 68904, 68912, 68922, 69216, 69247, 69248, 69290, 69291, 69293, 69296,
+    69298, 69376, 69416, 69424, 69446, 69457, 69461, 69488, 69506, 69510, 69552, 69580,
+    69600, 69623, 69632, 69633, 69634, 69635, 69688, 69703, 69714, 69744, 69745, 69747,
+    69749, 69750, 69759, 69762, 69763, 69808, 69811, 69815, 69817, 69819, 69821, 69822,
+    69826, 69827, 69837, 69838, 69840, 69865, 69872, 69882, 69888, 69891, 69927, 69932,
+    69933, 69941, 69942, 69952, 69956, 69957, 69959, 69960, 69968, 70003, 70004, 70006,
+    70007, 70016, 70018, 70019, 70067, 70070, 70079, 70081, 70082, 70084, 70085, 70089,
+    70093, 70094, 70095, 70096, 70107, 70108, 70109, 70113, 70133, 70144, 70162, 70163,
+    70188, 70191, 70194, 70196, 70197, 70198, 70200, 70206, 70207, 70272, 70279, 70280,
+    70281, 70282, 70286, 70287, 70302, 70303, 70313, 70320, 70367, 70368, 70371, 70379,
+    70384, 70394, 70400, 70402, 70404, 70405, 70413, 70415, 70417, 70419, 70441, 70442,
+    70449, 70450, 70452, 70453, 70458, 70459, 70461, 70462, 70464, 70465, 70469, 70471,
+    70473, 70475, 70478, 70480, 70481, 70487, 70488, 70493, 70498, 70500, 70502, 70509,
+    70512, 70517, 70656, 70709, 70712, 70720, 70722, 70725, 70726, 70727, 70731, 70736,
+    70746, 70750, 70751, 70754, 70784, 70832, 70835, 70841, 70842, 70843, 70847, 70849,
+    70850, 70852, 70854, 70855, 70856, 70864, 70874, 71040, 71087, 71090, 71094, 71096,
+    71100, 71102, 71103, 71105, 71128, 71132, 71134, 71168, 71216, 71219, 71227, 71229,
+    71230, 71231, 71233, 71236, 71237, 71248, 71258, 71296, 71339, 71340, 71341, 71342,
+    71344, 71350, 71351, 71352, 71353, 71360, 71370, 71424, 71451, 71453, 71456, 71458,
+    71462, 71463, 71468, 71472, 71484, 71488, 71495, 71680, 71724, 71727, 71736, 71737,
+    71739, 71840, 71923, 71935, 71943, 71945, 71946, 71948, 71956, 71957, 71959, 71960,
+    71984, 71990, 71991, 71993, 71995, 71997, 71998, 71999, 72000, 72001, 72002, 72003,
+    72004, 72016, 72026, 72096, 72104, 72106, 72145, 72148, 72152, 72154, 72156, 72160,
+    72161, 72162, 72163, 72164, 72165, 72192, 72193, 72203, 72243, 72249, 72250, 72251,
+    72255, 72263, 72264, 72272, 72273, 72279, 72281, 72284, 72324, 72330, 72343, 72344,
+    72346, 72349, 72350, 72368, 72441, 72704, 72713, 72714, 72751, 72752, 72759, 72760,
+    72766, 72767, 72768, 72769, 72784, 72813, 72818, 72848, 72850, 72872, 72873, 72874,
+    72881, 72882, 72884, 72885, 72887, 72960, 72967, 72968, 72970, 72971, 73009, 73015,
+    73018, 73019, 73020, 73022, 73023, 73030, 73031, 73032, 73040, 73050, 73056, 73062,
+    73063, 73065, 73066, 73098, 73103, 73104, 73106, 73107, 73109, 73110, 73111, 73112,
+    73113, 73120, 73130, 73440, 73459, 73461, 73463, 73648, 73649, 73664, 73685, 73728,
+    74650, 74752, 74863, 74880, 75076, 77712, 77809, 77824, 78895, 78896, 78905, 82944,
+    83527, 92160, 92729, 92736, 92767, 92768, 92778, 92784, 92863, 92864, 92874, 92880,
+    92910, 92912, 92917, 92928, 92976, 92983, 92992, 92996, 93008, 93018, 93019, 93026,
+    93027, 93048, 93053, 93072, 93760, 93847, 93952, 94027, 94031, 94032, 94033, 94088,
+    94095, 94099, 94112, 94176, 94178, 94179, 94180, 94181, 94192, 94194, 94208, 100344,
+    100352, 101590, 101632, 101641, 110576, 110580, 110581, 110588, 110589, 110591, 110592, 110593,
+    110880, 110883, 110928, 110931, 110948, 110952, 110960, 111356, 113664, 113771, 113776, 113789,
+    113792, 113801, 113808, 113818, 113821, 113823, 113824, 113828, 118528, 118574, 118576, 118599,
+    119141, 119143, 119146, 119149, 119155, 119163, 119171, 119173, 119180, 119210, 119214, 119362,
+    119365, 119520, 119540, 119648, 119673, 119808, 119893, 119894, 119965, 119966, 119968, 119970,
+    119971, 119973, 119975, 119977, 119981, 119982, 119994, 119995, 119996, 119997, 120004, 120005,
+    120070, 120071, 120075, 120077, 120085, 120086, 120093, 120094, 120122, 120123, 120127, 120128,
+    120133, 120134, 120135, 120138, 120145, 120146, 120486, 120488, 120513, 120514, 120539, 120540,
+    120571, 120572, 120597, 120598, 120629, 120630, 120655, 120656, 120687, 120688, 120713, 120714,
+    120745, 120746, 120771, 120772, 120780, 120782, 120832, 121344, 121399, 121403, 121453, 121461,
+    121462, 121476, 121477, 121499, 121504, 121505, 121520, 122624, 122655, 122880, 122887, 122888,
+    122905, 122907, 122914, 122915, 122917, 122918, 122923, 123136, 123181, 123184, 123191, 123198,
+    123200, 123210, 123214, 123215, 123536, 123566, 123567, 123584, 123628, 123632, 123642, 124896,
+    124903, 124904, 124908, 124909, 124911, 124912, 124927, 124928, 125125, 125127, 125136, 125143,
+    125184, 125252, 125259, 125260, 125264, 125274, 126065, 126124, 126125, 126128, 126129, 126133,
+    126209, 126254, 126255, 126270, 126464, 126468, 126469, 126496, 126497, 126499, 126500, 126501,
+    126503, 126504, 126505, 126515, 126516, 126520, 126521, 126522, 126523, 126524, 126530, 126531,
+    126535, 126536, 126537, 126538, 126539, 126540, 126541, 126544, 126545, 126547, 126548, 126549,
+    126551, 126552, 126553, 126554, 126555, 126556, 126557, 126558, 126559, 126560, 126561, 126563,
+    126564, 126565, 126567, 126571, 126572, 126579, 126580, 126584, 126585, 126589, 126590, 126591,
+    126592, 126602, 126603, 126620, 126625, 126628, 126629, 126634, 126635, 126652, 126976, 127232,
+    127245, 127248, 127279, 127280, 127340, 127346, 127358, 127360, 127374, 127375, 127377, 127387,
+    127405, 127462, 127488, 127489, 127504, 127514, 127515, 127535, 127536, 127538, 127547, 127548,
+    127552, 127561, 127995, 128000, 128318, 128326, 128592, 128640, 128768, 128884, 128896, 128981,
+    129024, 129036, 129040, 129096, 129104, 129114, 129120, 129160, 129168, 129198, 129280, 129292,
+    129339, 129340, 129350, 129351, 129792, 130032, 130042, 130048, 131070, 131072, 173792, 173824,
+    177977, 177984, 178206, 178208, 183970, 183984, 191457, 194560, 195102, 196608, 201547, 917505,
+    917506, 917536, 917632, 917760, 918000,
+)
+
+VALUES = (
+    16, 2, 0, 3, 0, 3, 0, 3, 0, 16, 2, 0,
+    192, 3, 0, 17, 192, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 33, 3, 0, 3, 0, 3, 0, 3,
+    0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3,
+    0, 33, 3, 0, 3, 0, 3, 0, 3, 0, 33, 0,
+    33, 0, 33, 0, 33, 0, 33, 0, 3, 0, 3, 0,
+    81, 0, 33, 0, 17, 0, 3, 33, 3, 0, 3, 33,
+    3, 0, 3, 33, 81, 0, 33, 3, 33, 0, 33, 3,
+    0, 3, 0, 81, 3, 33, 3, 33, 0, 3, 33, 3,
+    0, 3, 33, 3, 0, 3, 0, 33, 0, 3, 33, 3,
+    33, 3, 33, 3, 33, 0, 3, 33, 0, 3, 0, 3,
+    0, 3, 0, 81, 0, 33, 3, 33, 81, 33, 65, 3,
+    33, 65, 33, 3, 65, 33, 65, 33, 65, 3, 33, 3,
+    33, 0, 3, 0, 3, 33, 65, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 33, 3, 65, 33,
+    0, 65, 0, 65, 33, 3, 0, 65, 0, 3, 0, 3,
+    33, 0, 3, 0, 3, 0, 3, 0, 33, 0, 33, 65,
+    0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3,
+    0, 3, 0, 33, 0, 65, 33, 0, 33, 0, 33, 0,
+    33, 0, 3, 0, 3, 0, 3, 33, 3, 33, 0, 33,
+    65, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 33, 3, 65, 33, 0, 33, 65, 0, 65, 33,
+    0, 3, 0, 3, 33, 0, 3, 0, 3, 33, 0, 33,
+    65, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 33, 3, 65, 33, 65, 33, 0, 65, 0, 65,
+    33, 0, 33, 65, 0, 3, 0, 3, 33, 0, 3, 0,
+    3, 0, 33, 3, 0, 3, 0, 3, 0, 3, 0, 3,
+    0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 65,
+    33, 65, 0, 65, 0, 65, 33, 0, 3, 0, 65, 0,
+    3, 0, 33, 65, 33, 3, 0, 3, 0, 3, 0, 3,
+    0, 33, 3, 33, 65, 0, 33, 0, 33, 0, 33, 0,
+    3, 0, 3, 0, 3, 33, 0, 3, 0, 3, 0, 3,
+    33, 65, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3,
+    0, 33, 3, 65, 33, 65, 0, 33, 65, 0, 65, 33,
+    0, 65, 0, 3, 0, 3, 33, 0, 3, 0, 3, 0,
+    33, 65, 3, 0, 3, 0, 3, 33, 3, 65, 33, 0,
+    65, 0, 65, 33, 83, 0, 3, 65, 3, 33, 0, 3,
+    0, 3, 0, 33, 65, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 33, 0, 65, 33, 0, 33, 0, 65,
+    0, 3, 0, 65, 0, 3, 33, 3, 33, 0, 3, 33,
+    0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3,
+    0, 3, 33, 3, 33, 3, 0, 3, 0, 3, 0, 33,
+    0, 3, 0, 3, 0, 3, 0, 33, 0, 3, 0, 33,
+    0, 33, 0, 33, 0, 65, 3, 0, 3, 0, 33, 65,
+    33, 0, 33, 3, 33, 0, 33, 0, 33, 0, 3, 65,
+    33, 65, 33, 65, 33, 65, 33, 3, 0, 3, 65, 33,
+    3, 33, 3, 65, 3, 65, 3, 33, 3, 33, 65, 33,
+    65, 33, 3, 65, 3, 65, 33, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 115, 131, 147, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 33, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 2, 3, 0, 3, 0, 3, 0,
+    3, 33, 65, 0, 3, 33, 65, 0, 3, 33, 0, 3,
+    0, 3, 0, 33, 0, 3, 33, 65, 33, 65, 33, 65,
+    33, 0, 3, 0, 3, 33, 0, 3, 0, 3, 0, 33,
+    17, 33, 3, 0, 3, 0, 3, 33, 3, 33, 3, 0,
+    3, 0, 3, 0, 33, 65, 33, 65, 0, 65, 33, 65,
+    33, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 33, 65, 33, 0, 3, 65, 33, 65, 33, 0, 33,
+    65, 33, 65, 33, 65, 33, 0, 33, 3, 0, 3, 0,
+    3, 0, 33, 0, 33, 65, 3, 33, 65, 33, 65, 33,
+    65, 33, 65, 3, 0, 3, 0, 33, 0, 33, 65, 3,
+    65, 33, 65, 33, 65, 33, 3, 33, 65, 33, 65, 33,
+    65, 33, 65, 0, 3, 65, 33, 65, 33, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 33, 0, 33, 65,
+    33, 3, 33, 3, 33, 3, 65, 33, 3, 0, 3, 33,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 2, 17, 33, 49, 17, 0, 16, 17, 2, 0,
+    192, 0, 192, 0, 2, 17, 0, 17, 3, 0, 3, 0,
+    3, 0, 3, 0, 33, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 192, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 195, 0, 3, 0, 3, 0, 3, 0, 3,
+    0, 192, 0, 192, 0, 192, 0, 192, 0, 192, 0, 192,
+    0, 192, 0, 192, 0, 3, 0, 192, 0, 3, 0, 192,
+    0, 192, 0, 192, 0, 192, 0, 192, 0, 192, 0, 192,
+    0, 192, 0, 192, 0, 192, 0, 192, 0, 192, 0, 192,
+    0, 192, 0, 192, 0, 192, 0, 192, 0, 192, 0, 192,
+    0, 192, 0, 192, 0, 192, 0, 3, 0, 192, 0, 192,
+    0, 192, 0, 192, 0, 192, 0, 192, 0, 192, 0, 192,
+    0, 192, 0, 3, 0, 3, 33, 3, 0, 3, 0, 3,
+    0, 3, 0, 3, 0, 3, 0, 3, 0, 33, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 33, 0, 3, 0, 2, 0, 7, 4,
+    0, 3, 33, 65, 192, 3, 0, 3, 192, 0, 5, 0,
+    33, 6, 7, 5, 0, 6, 0, 7, 6, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 6, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 192, 0, 192, 0, 3, 0, 6, 0,
+    6, 0, 4, 0, 4, 3, 0, 3, 0, 3, 0, 3,
+    0, 3, 33, 0, 33, 0, 3, 33, 3, 33, 0, 3,
+    0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3,
+    33, 3, 33, 3, 33, 3, 65, 33, 65, 0, 33, 0,
+    3, 0, 3, 0, 65, 3, 65, 33, 0, 3, 0, 33,
+    3, 0, 3, 0, 3, 33, 3, 33, 0, 3, 33, 65,
+    0, 115, 0, 33, 65, 3, 33, 65, 33, 65, 33, 65,
+    0, 3, 0, 3, 33, 3, 0, 3, 33, 65, 33, 65,
+    33, 0, 3, 33, 3, 33, 65, 0, 3, 0, 3, 0,
+    3, 65, 33, 65, 3, 33, 3, 33, 3, 33, 3, 33,
+    3, 33, 3, 0, 3, 0, 3, 65, 33, 65, 0, 3,
+    65, 33, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3,
+    0, 3, 0, 3, 0, 3, 65, 33, 65, 33, 65, 0,
+    65, 33, 0, 3, 0, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 163,
+    179, 163, 179, 163, 179, 163, 179, 163, 179, 163, 179, 0,
+    131, 0, 147, 0, 16, 0, 4, 0, 4, 0, 3, 0,
+    3, 0, 3, 33, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 33, 0, 33, 0, 3, 0, 3, 0, 17, 0,
+    3, 0, 3, 0, 3, 0, 6, 7, 6, 35, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 17, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 33, 0, 3, 0, 3, 0,
+    33, 3, 0, 3, 0, 3, 0, 3, 33, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 33, 0, 33, 0, 33, 3, 0,
+    3, 0, 3, 0, 33, 0, 33, 3, 0, 3, 0, 3,
+    0, 3, 0, 3, 33, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 33, 0, 3, 0, 3, 0, 3, 0, 33, 0, 3,
+    0, 3, 0, 3, 33, 3, 0, 3, 33, 0, 3, 0,
+    3, 0, 65, 33, 65, 3, 33, 0, 3, 33, 3, 33,
+    3, 0, 33, 65, 3, 65, 33, 65, 33, 0, 81, 0,
+    33, 0, 81, 0, 3, 0, 3, 0, 33, 3, 33, 65,
+    33, 0, 3, 0, 3, 65, 3, 0, 3, 33, 0, 3,
+    0, 33, 65, 3, 65, 33, 65, 3, 83, 3, 0, 33,
+    0, 65, 33, 3, 0, 3, 0, 3, 0, 3, 0, 3,
+    65, 33, 65, 33, 65, 33, 0, 33, 0, 3, 0, 3,
+    0, 3, 0, 3, 0, 3, 0, 3, 33, 65, 33, 0,
+    3, 0, 33, 65, 0, 3, 0, 3, 0, 3, 0, 3,
+    0, 3, 0, 3, 0, 33, 3, 65, 33, 65, 0, 65,
+    0, 65, 0, 3, 0, 65, 0, 3, 65, 0, 33, 0,
+    33, 0, 3, 65, 33, 65, 33, 65, 33, 3, 0, 3,
+    0, 33, 3, 0, 3, 65, 33, 65, 33, 65, 33, 65,
+    33, 3, 0, 3, 0, 3, 0, 3, 65, 33, 0, 65,
+    33, 65, 33, 0, 3, 33, 0, 3, 65, 33, 65, 33,
+    65, 33, 0, 3, 0, 3, 0, 3, 33, 65, 33, 65,
+    33, 65, 33, 3, 0, 3, 0, 3, 0, 33, 65, 33,
+    65, 33, 0, 3, 0, 3, 0, 3, 65, 33, 65, 33,
+    0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3,
+    65, 0, 65, 0, 33, 65, 33, 83, 65, 83, 65, 33,
+    0, 3, 0, 3, 0, 3, 65, 33, 0, 33, 65, 33,
+    3, 0, 3, 65, 0, 3, 33, 3, 33, 65, 83, 33,
+    0, 33, 0, 3, 33, 65, 33, 3, 83, 33, 65, 33,
+    0, 3, 0, 3, 0, 3, 0, 3, 65, 33, 0, 33,
+    65, 33, 3, 0, 3, 0, 3, 0, 33, 0, 65, 33,
+    65, 33, 65, 33, 0, 3, 0, 3, 0, 3, 33, 0,
+    33, 0, 33, 0, 33, 83, 33, 0, 3, 0, 3, 0,
+    3, 0, 3, 65, 0, 33, 0, 65, 33, 65, 33, 3,
+    0, 3, 0, 3, 33, 65, 0, 3, 0, 3, 0, 3,
+    0, 3, 0, 3, 0, 3, 0, 3, 0, 17, 0, 3,
+    0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3,
+    0, 33, 0, 3, 33, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 33, 3, 65, 0,
+    33, 3, 0, 3, 0, 3, 33, 0, 65, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 6, 5,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 33, 0, 17, 0, 33, 0, 33, 0,
+    65, 33, 0, 65, 17, 33, 0, 33, 0, 33, 0, 33,
+    0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3,
+    0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3,
+    0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3,
+    0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3,
+    0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3,
+    0, 3, 0, 3, 0, 3, 0, 33, 0, 33, 0, 33,
+    0, 33, 0, 33, 0, 33, 0, 3, 0, 33, 0, 33,
+    0, 33, 0, 33, 0, 33, 0, 3, 0, 33, 3, 0,
+    3, 0, 3, 0, 3, 33, 0, 3, 33, 3, 0, 3,
+    0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 33, 0,
+    3, 33, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0,
+    3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 192, 3,
+    192, 0, 192, 0, 192, 0, 192, 0, 192, 0, 192, 0,
+    192, 96, 0, 192, 0, 192, 0, 192, 0, 192, 0, 192,
+    0, 192, 33, 192, 0, 192, 0, 192, 0, 192, 0, 192,
+    0, 192, 0, 192, 0, 192, 0, 192, 0, 192, 0, 192,
+    0, 192, 0, 192, 0, 3, 0, 192, 0, 4, 0, 4,
+    0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 17,
+    0, 33, 0, 33, 0,
+)
@@ -56,7 +56,7 @@ class Window(Gtk.ApplicationWindow):
         scrolled_window.set_policy(
             Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
 
-        self.textview = FuriganaView()
+        self.textview = FuriganaView(resources=app.get_resources())
         self.textview.connect_after('focus-in-event', self.on_textview_focus_in)
         self.textview.connect_after('focus-out-event', self.on_textview_focus_out)
 
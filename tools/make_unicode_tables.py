@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025  Esrille Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+# Generates src/unicodetables.py used by src/segmenter.py from the Unicode
+# database of the running Python, e.g.,
+#
+#   $ tools/make_unicode_tables.py src/unicodetables.py
+
+import sys
+import unicodedata
+
+
+# Grapheme_Cluster_Break
+OTHER = 0
+CONTROL = 1
+EXTEND = 2
+ZWJ = 3
+SPACING_MARK = 4
+PREPEND = 5
+REGIONAL_INDICATOR = 6
+L = 7
+V = 8
+T = 9
+LV = 10
+LVT = 11
+EXTENDED_PICTOGRAPHIC = 12
+
+# Word classes for Japanese script runs
+WORD_OTHER = 0
+WORD_IGNORE = 1
+WORD_SPACE = 2
+WORD_LETTER = 3
+WORD_HAN = 4
+WORD_HIRAGANA = 5
+WORD_KATAKANA = 6
+WORD_EXTENDER = 7
+
+PREPENDS = (
+    (0x0600, 0x0605), (0x06DD, 0x06DD), (0x070F, 0x070F), (0x0890, 0x0891),
+    (0x08E2, 0x08E2), (0x0D4E, 0x0D4E), (0x110BD, 0x110BD), (0x110CD, 0x110CD),
+    (0x111C2, 0x111C3), (0x1193F, 0x1193F), (0x11941, 0x11941), (0x11A3A, 0x11A3A),
+    (0x11A84, 0x11A89), (0x11D46, 0x11D46),
+)
+
+EXTENDED_PICTOGRAPHICS = (
+    (0x00A9, 0x00A9), (0x00AE, 0x00AE), (0x203C, 0x203C), (0x2049, 0x2049),
+    (0x2122, 0x2122), (0x2139, 0x2139), (0x2194, 0x2199), (0x21A9, 0x21AA),
+    (0x231A, 0x231B), (0x2328, 0x2328), (0x2388, 0x2388), (0x23CF, 0x23CF),
+    (0x23E9, 0x23F3), (0x23F8, 0x23FA), (0x24C2, 0x24C2), (0x25AA, 0x25AB),
+    (0x25B6, 0x25B6), (0x25C0, 0x25C0), (0x25FB, 0x25FE), (0x2600, 0x2605),
+    (0x2607, 0x2612), (0x2614, 0x2685), (0x2690, 0x2705), (0x2708, 0x2712),
+    (0x2714, 0x2714), (0x2716, 0x2716), (0x271D, 0x271D), (0x2721, 0x2721),
+    (0x2728, 0x2728), (0x2733, 0x2734), (0x2744, 0x2744), (0x2747, 0x2747),
+    (0x274C, 0x274C), (0x274E, 0x274E), (0x2753, 0x2755), (0x2757, 0x2757),
+    (0x2763, 0x2767), (0x2795, 0x2797), (0x27A1, 0x27A1), (0x27B0, 0x27B0),
+    (0x27BF, 0x27BF), (0x2934, 0x2935), (0x2B05, 0x2B07), (0x2B1B, 0x2B1C),
+    (0x2B50, 0x2B50), (0x2B55, 0x2B55), (0x3030, 0x3030), (0x303D, 0x303D),
+    (0x3297, 0x3297), (0x3299, 0x3299), (0x1F000, 0x1F0FF), (0x1F10D, 0x1F10F),
+    (0x1F12F, 0x1F12F), (0x1F16C, 0x1F171), (0x1F17E, 0x1F17F), (0x1F18E, 0x1F18E),
+    (0x1F191, 0x1F19A), (0x1F1AD, 0x1F1E5), (0x1F201, 0x1F20F), (0x1F21A, 0x1F21A),
+    (0x1F22F, 0x1F22F), (0x1F232, 0x1F23A), (0x1F23C, 0x1F23F), (0x1F249, 0x1F3FA),
+    (0x1F400, 0x1F53D), (0x1F546, 0x1F64F), (0x1F680, 0x1F6FF), (0x1F774, 0x1F77F),
+    (0x1F7D5, 0x1F7FF), (0x1F80C, 0x1F80F), (0x1F848, 0x1F84F), (0x1F85A, 0x1F85F),
+    (0x1F888, 0x1F88F), (0x1F8AE, 0x1F8FF), (0x1F90C, 0x1F93A), (0x1F93C, 0x1F945),
+    (0x1F947, 0x1FAFF), (0x1FC00, 0x1FFFD),
+)
+
+# Characters that continue the script run before them
+EXTENDERS = '々〆ゝゞヽヾーｰ'
+
+
+def in_ranges(cp, ranges):
+    for first, last in ranges:
+        if first <= cp <= last:
+            return True
+    return False
+
+
+def get_grapheme_cluster_break(cp, category):
+    if 0x1F1E6 <= cp <= 0x1F1FF:
+        return REGIONAL_INDICATOR
+    if cp == 0x200D:
+        return ZWJ
+    if 0x1100 <= cp <= 0x115F or 0xA960 <= cp <= 0xA97C:
+        return L
+    if 0x1160 <= cp <= 0x11A7 or 0xD7B0 <= cp <= 0xD7C6:
+        return V
+    if 0x11A8 <= cp <= 0x11FF or 0xD7CB <= cp <= 0xD7FB:
+        return T
+    if 0xAC00 <= cp <= 0xD7A3:
+        return LV if (cp - 0xAC00) % 28 == 0 else LVT
+    if in_ranges(cp, PREPENDS):
+        return PREPEND
+    if (category in ('Mn', 'Me') or cp == 0x200C or 0x1F3FB <= cp <= 0x1F3FF
+            or 0xFF9E <= cp <= 0xFF9F or 0xE0020 <= cp <= 0xE007F):
+        return EXTEND
+    if category == 'Mc':
+        return SPACING_MARK
+    if category in ('Cc', 'Cf', 'Cs', 'Zl', 'Zp'):
+        return CONTROL
+    if in_ranges(cp, EXTENDED_PICTOGRAPHICS):
+        return EXTENDED_PICTOGRAPHIC
+    return OTHER
+
+
+def get_word_class(cp, category, c):
+    if category in ('Mn', 'Me', 'Mc', 'Cf') or 0x1F3FB <= cp <= 0x1F3FF:
+        return WORD_IGNORE
+    if category == 'Zs':
+        return WORD_SPACE
+    if c in EXTENDERS:
+        return WORD_EXTENDER
+    if 0x3041 <= cp <= 0x3096 or cp == 0x309F or 0x1B001 <= cp <= 0x1B11F:
+        return WORD_HIRAGANA
+    if (0x309B <= cp <= 0x309C or 0x30A1 <= cp <= 0x30FA or cp == 0x30FF
+            or 0x31F0 <= cp <= 0x31FF or 0x32D0 <= cp <= 0x32FE or 0x3300 <= cp <= 0x3357
+            or 0xFF66 <= cp <= 0xFF9D or cp == 0x1B000):
+        return WORD_KATAKANA
+    if unicodedata.name(c, '').startswith(('CJK UNIFIED IDEOGRAPH', 'CJK COMPATIBILITY IDEOGRAPH')) or c == '〇':
+        return WORD_HAN
+    if category[0] in 'LN':
+        return WORD_LETTER
+    return WORD_OTHER
+
+
+def make_tables():
+    starts = []
+    values = []
+    for cp in range(0x110000):
+        c = chr(cp)
+        category = unicodedata.category(c)
+        value = (get_grapheme_cluster_break(cp, category) << 4) | get_word_class(cp, category, c)
+        if not values or values[-1] != value:
+            starts.append(cp)
+            values.append(value)
+    return starts, values
+
+
+def write_tuple(file, name, items):
+    file.write(f'{name} = (\n')
+    for i in range(0, len(items), 12):
+        file.write('    ' + ' '.join(f'{item},' for item in items[i:i + 12]) + '\n')
+    file.write(')\n')
+
+
+HEADER = '''#
+# Copyright (c) 2025  Esrille Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+'''
+
+
+def main(pathname):
+    starts, values = make_tables()
+    with open(pathname, 'w') as file:
+        file.write(HEADER)
+        file.write('# Generated by tools/make_unicode_tables.py from Unicode '
+                   f'{unicodedata.unidata_version}. Do not edit.\n')
+        file.write('#\n')
+        file.write('# The character at code point c has the property values VALUES[i] where\n')
+        file.write('# STARTS[i] <= c < STARTS[i + 1]. The upper four bits are the\n')
+        file.write('# Grapheme_Cluster_Break and the lower four bits are the word class.\n\n')
+        write_tuple(file, 'STARTS', starts)
+        file.write('\n')
+        write_tuple(file, 'VALUES', values)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        sys.exit(0)
+    main(sys.argv[1])